@@ -1,5 +1,9 @@
 from llvmlite import ir
+import hashlib
+import math
+import operator
 import os
+import pickle
 
 from lime_ast import Node, NodeType, Program, Expression, ImportStatement
 from lime_ast import ExpressionStatement, InfixExpression, LetStatement, CallExpression
@@ -16,6 +20,20 @@ from lime_lexer import Lexer
 from lime_parser import Parser
 
 class Compiler:
+    # operator -> IRBuilder method name tables, looked up once per infix
+    # expression instead of scanning a match/case ladder on every visit
+    _INT_ARITH_OPS: dict[str, str] = {"+": "add", "-": "sub", "*": "mul", "/": "sdiv", "%": "srem"}
+    _FLOAT_ARITH_OPS: dict[str, str] = {"+": "fadd", "-": "fsub", "*": "fmul", "/": "fdiv", "%": "frem"}
+    _COMPARISON_OPS: frozenset[str] = frozenset(("<", "<=", ">", ">=", "==", "!="))
+    _CMP_FUNCS: dict[str, callable] = {
+        "<": operator.lt, "<=": operator.le,
+        ">": operator.gt, ">=": operator.ge,
+        "==": operator.eq, "!=": operator.ne,
+    }
+
+    # where parsed import ASTs are pickled between runs
+    AST_CACHE_DIR: str = ".lime_cache"
+
     def __init__(self) -> None:
         self.type_map: dict[str, ir.Type] = {
             "int": ir.IntType(32),
@@ -25,6 +43,12 @@ class Compiler:
             "void": ir.VoidType()
         }
 
+        # cached singleton types so hot paths skip the dict lookup / constructor
+        self._int_type: ir.Type = self.type_map["int"]
+        self._float_type: ir.Type = self.type_map["float"]
+        self._bool_type: ir.Type = self.type_map["bool"]
+        self._str_type: ir.Type = self.type_map["str"]
+
         self.module: ir.Module = ir.Module("main")
         self.builder: ir.IRBuilder = ir.IRBuilder()
         self.env: Environment = Environment()
@@ -42,87 +66,128 @@ class Compiler:
         # keeps a reference to parsed pallets
         self.global_parsed_pallets: dict[str, Program] = {}
 
+        # module name -> resolved file path, so repeated imports skip the
+        # three-location isfile probe
+        self._module_path_cache: dict[str, str] = {}
 
-    def __initialize_builtins(self) -> None:
-        def __init_print() -> ir.Function:
-            fnty: ir.FunctionType = ir.FunctionType(
-                self.type_map['int'],
-                [ir.IntType(8).as_pointer()],
-                var_arg=True
-            )
-            return ir.Function(self.module, fnty, name="printf")
+        # hash-cons cache so repeated literals share one ir.Constant object
+        self._const_cache: dict[tuple[str, int | float | bool], ir.Constant] = {}
 
-        def __init_booleans() -> tuple[ir.GlobalVariable, ir.GlobalVariable]:
-            bool_type: ir.Type = self.type_map["bool"]
+        # preallocated singletons for the small integers nearly every program
+        # uses (loop bounds, increments), indexed directly instead of hashed
+        self._small_int_consts: list[ir.Constant] = [ir.Constant(self._int_type, i) for i in range(-5, 257)]
 
-            true_global = ir.GlobalVariable(self.module, bool_type, name="true")
-            true_global.linkage = 'internal'
-            true_global.global_constant = True
-            true_global.initializer = ir.Constant(bool_type, 1)
+        # the two boolean constants, shared by every literal visit
+        self._const_true: ir.Constant = ir.Constant(self._bool_type, 1)
+        self._const_false: ir.Constant = ir.Constant(self._bool_type, 0)
 
-            false_global = ir.GlobalVariable(self.module, ir.IntType(1), name="false")
-            false_global.linkage = 'internal'
-            false_global.global_constant = True
-            false_global.initializer = ir.Constant(ir.IntType(1), 0)
+        # one declaration per intrinsic and one global per distinct string,
+        # so repeated uses do not grow the module symbol table
+        self._intrinsic_cache: dict[str, ir.Function] = {}
+        self._str_globals: dict[bytes, ir.GlobalVariable] = {}
 
-            return true_global, false_global
-        
-        self.env.define("printf", __init_print(), ir.IntType(32))
+        # stack slots already allocated for a (scope, name, type) binding, so
+        # re-typing lets reuse their old slot instead of piling up allocas
+        self._slot_cache: dict[tuple[Environment, str, ir.Type], ir.Value] = {}
 
-        true_global, false_global = __init_booleans()
-        self.env.define("true", true_global, self.type_map["bool"])
-        self.env.define("false", false_global, self.type_map["bool"])
+        # block-local cache of identifier loads; keyed by name, valid only while
+        # the builder stays in the block it was filled in
+        self._id_value_cache: dict[str, ir.Value] = {}
+        self._id_cache_block: ir.Block | None = None
 
-    def compile(self, node: Node) -> None:
-        match node.type():
-            case NodeType.Program:
-                self.__visit_program(node)
-
-            # statements
-            case NodeType.ExpressionStatement:
-                self.__visit_expression_statement(node)
+        # (operand type, operator) -> bound builder method, so the infix hot
+        # path is one dict lookup + one call instead of isinstance + getattr
+        self._infix_ops: dict[tuple[type, str], callable] = {}
+        self._refresh_infix_ops()
 
-            case NodeType.LetStatement:
-                self.__visit_let_statement(node)
+        # jump table mapping node types to their visit methods, so `compile`
+        # does a single dict lookup instead of a linear match/case scan
+        self._compile_dispatch: dict[NodeType, callable] = {
+            NodeType.Program: self.__visit_program,
 
-            case NodeType.FunctionStatement:
-                self.__visit_function_statement(node)
-
-            case NodeType.BlockStatement:
-                self.__visit_block_statement(node)
+            # statements
+            NodeType.ExpressionStatement: self.__visit_expression_statement,
+            NodeType.LetStatement: self.__visit_let_statement,
+            NodeType.FunctionStatement: self.__visit_function_statement,
+            NodeType.BlockStatement: self.__visit_block_statement,
+            NodeType.ReturnStatement: self.__visit_return_statement,
+            NodeType.AssignStatement: self.__visit_assign_statement,
+            NodeType.IfStatement: self.__visit_if_statement,
+            NodeType.WhileStatement: self.__visit_while_statement,
+            NodeType.BreakStatement: self.__visit_break_statement,
+            NodeType.ContinueStatement: self.__visit_continue_statement,
+            NodeType.ForStatement: self.__visit_for_statement,
+            NodeType.ImportStatement: self.__visit_import_statement,
+
+            # expressions
+            NodeType.InfixExpression: self.__visit_infix_expression,
+            NodeType.CallExpression: self.__visit_call_expression,
+            NodeType.PostfixExpression: self.__visit_postfix_expression,
+        }
 
-            case NodeType.ReturnStatement:
-                self.__visit_return_statement(node)
-            
-            case NodeType.AssignStatement:
-                self.__visit_assign_statement(node)
+        # same idea for `__resolve_value`: one dict lookup per expression node
+        self._resolve_dispatch: dict[NodeType, callable] = {
+            NodeType.IntegerLiteral: self.__resolve_integer_literal,
+            NodeType.FloatLiteral: self.__resolve_float_literal,
+            NodeType.IdentifierLiteral: self.__resolve_identifier_literal,
+            NodeType.BooleanLiteral: self.__resolve_boolean_literal,
+            NodeType.StringLiteral: self.__resolve_string_literal,
+
+            NodeType.InfixExpression: self.__visit_infix_expression,
+            NodeType.CallExpression: self.__visit_call_expression,
+            NodeType.PrefixExpression: self.__visit_prefix_expression,
+            NodeType.PostfixExpression: self.__visit_postfix_expression,
+        }
 
-            case NodeType.IfStatement:
-                self.__visit_if_statement(node)
 
-            case NodeType.WhileStatement:
-                self.__visit_while_statement(node)
+    def _refresh_infix_ops(self) -> None:
+        """ Rebinds the arithmetic method table to the current builder. Must be called
+        whenever `self.builder` is replaced with a new IRBuilder. """
+        builder = self.builder
+        ops: dict[tuple[type, str], callable] = {}
+        for op, name in self._INT_ARITH_OPS.items():
+            ops[(ir.IntType, op)] = getattr(builder, name)
+        for op, name in self._FLOAT_ARITH_OPS.items():
+            ops[(ir.FloatType, op)] = getattr(builder, name)
+        self._infix_ops = ops
 
-            case NodeType.BreakStatement:
-                self.__visit_break_statement(node) 
+        # comparisons go through one fixed method per operand kind, so those
+        # are pre-bound directly rather than stored in the table
+        self._icmp_signed = builder.icmp_signed
+        self._fcmp_ordered = builder.fcmp_ordered
 
-            case NodeType.ContinueStatement:
-                self.__visit_continue_statement(node)
+    def __initialize_builtins(self) -> None:
+        def __init_print() -> ir.Function:
+            fnty: ir.FunctionType = ir.FunctionType(
+                self._int_type,
+                [self._str_type],
+                var_arg=True
+            )
+            return ir.Function(self.module, fnty, name="printf")
 
-            case NodeType.ForStatement:
-                self.__visit_for_statement(node)
+        def __init_booleans() -> tuple[ir.GlobalVariable, ir.GlobalVariable]:
+            bool_type: ir.Type = self._bool_type
+            true_global = self._make_const_global(bool_type, ir.Constant(bool_type, 1), "true")
+            false_global = self._make_const_global(bool_type, ir.Constant(bool_type, 0), "false")
+            return true_global, false_global
+        
+        # cached handle so each printf call site skips the env chain walk
+        self._printf_func: ir.Function = __init_print()
+        self.env.define("printf", self._printf_func, self._int_type)
 
-            case NodeType.ImportStatement:
-                self.__visit_import_statement(node)
+        true_global, false_global = __init_booleans()
+        self.env.define("true", true_global, self._bool_type)
+        self.env.define("false", false_global, self._bool_type)
 
+    def compile(self, node: Node) -> None:
+        # once an error has been recorded the IR is going to be discarded, so
+        # stop walking instead of compounding secondary errors
+        if self.errors:
+            return
 
-            # Expressions
-            case NodeType.InfixExpression:
-                self.__visit_infix_expression(node)
-            case NodeType.CallExpression:
-                self.__visit_call_expression(node)
-            case NodeType.PostfixExpression:
-                self.__visit_postfix_expression(node)
+        visit = self._compile_dispatch.get(node.type)
+        if visit is not None:
+            visit(node)
 
 # region visit methods
     def __visit_program(self, node: Program) -> None:
@@ -137,8 +202,13 @@ class Compiler:
 
         # self.builder = ir.IRBuilder(block)
 
+        # dispatch each statement directly through the jump table instead of
+        # re-entering `compile` per child
+        dispatch = self._compile_dispatch
         for stmt in node.statements:
-            self.compile(stmt)
+            visit = dispatch.get(stmt.type)
+            if visit is not None:
+                visit(stmt)
 
         # return_value: ir.Constant = ir.Constant(self.type_map["int"], 69)
         # self.builder.ret(return_value)
@@ -154,31 +224,46 @@ class Compiler:
 
         value, Type = self.__resolve_value(node = value)
 
-        if self.env.lookup(name) is None:
-            # Define and allocate the Variable
-            ptr = self.builder.alloca(Type)
+        self.__invalidate_cached_load(name)
+
+        entry = self.env.lookup(name)
+        if entry is None:
+            # Define and allocate the Variable in the entry block
+            ptr = self.__slot_for(name, Type)
 
             # Storing the value to the ptr
             self.builder.store(value, ptr)
-            
+
             # add the variable to the environment
             self.env.define(name, ptr, Type)
 
-        else: 
-            ptr, old_type = self.env.lookup(name)
+        else:
+            ptr, old_type = entry
             # If types match, reuse existing pointer
             if old_type == Type:
                 self.builder.store(value, ptr)
             else:
-                # Allocate new pointer for different type and update environment
-                ptr = self.builder.alloca(Type)
+                # Rebinding to a different type: reuse the slot a previous
+                # binding of this (scope, name, type) allocated, if any
+                ptr = self.__slot_for(name, Type)
                 self.builder.store(value, ptr)
                 self.env.define(name, ptr, Type)
 
+        self.__note_store(name, value)
+
 
     def __visit_block_statement(self, node: BlockStatement) -> None:
+        dispatch = self._compile_dispatch
         for stmt in node.statements:
-            self.compile(stmt)
+            visit = dispatch.get(stmt.type)
+            if visit is not None:
+                visit(stmt)
+
+            # anything after a return/break/continue in this block is
+            # unreachable; skip it rather than make LLVM delete it
+            block = self.builder.block
+            if block is not None and block.is_terminated:
+                break
 
     def __visit_return_statement(self, node: ReturnStatement) -> None:
         value: Expression = node.return_value
@@ -190,48 +275,103 @@ class Compiler:
         body: BlockStatement = node.body
         params: list[FunctionParameter] = node.parameters
 
-        # keep track of the names of each parameter
-        params_names: list[str] = [param.name for param in params]
-
-        # keep track of the types for each parameter
-        params_types: list[ir.Type] = [self.type_map[param.value_type] for param in params]
+        # gather the name and type of each parameter in one pass; local alias
+        # keeps the loop free of repeated self lookups
+        tmap = self.type_map
+        params_names: list[str] = []
+        params_types: list[ir.Type] = []
+        for param in params:
+            params_names.append(param.name)
+            params_types.append(tmap[param.value_type])
 
-        return_type: ir.Type = self.type_map[node.return_type]
+        return_type: ir.Type = tmap[node.return_type]
 
         fnty: ir.FunctionType = ir.FunctionType(return_type, params_types)
         func: ir.Function = ir.Function(self.module, fnty, name=name)
 
         block: ir.Block = func.append_basic_block(f"{name}_entry")
 
-        previous_builder = self.builder
-
-        self.builder = ir.IRBuilder(block)
-
-        # staring the pointers to each parameter
-        params_ptr = []
-        for i, typ in enumerate(params_types):
-            ptr = self.builder.alloca(typ)
-            self.builder.store(func.args[i], ptr)
-            params_ptr.append(ptr)
+        # reposition the one shared builder rather than allocating a new
+        # IRBuilder per function; the pre-bound op table stays valid
+        previous_block = self.builder.block
+        self.builder.position_at_end(block)
 
-
-        # adding the parameters to the environment
         previous_env = self.env
-        self.env = Environment(parent=previous_env)
-        for i, x in enumerate(zip(params_types, params_names)):
-            typ = params_types[i]
-            ptr = params_ptr[i]
 
-            self.env.define(x[1], ptr, typ)
+        # define the function in the enclosing scope before compiling the
+        # body, so the body can resolve recursive calls through the chain
+        previous_env.define(name, func, return_type)
 
-        self.env.define(name, func, return_type)
+        # spill each argument to its stack slot and bind it in the function's
+        # scope in a single pass
+        self.env = Environment(parent=previous_env)
+        assigned = self.__collect_assigned_names(body)
+        alloca = self.__alloca
+        store = self.builder.store
+        define = self.env.define
+        for param_name, typ, arg in zip(params_names, params_types, func.args):
+            if param_name in assigned:
+                ptr = alloca(typ)
+                store(arg, ptr)
+                define(param_name, ptr, typ)
+            else:
+                # read-only parameter: bind the SSA argument directly, no
+                # stack slot needed
+                define(param_name, arg, typ)
 
         self.compile(body)
 
         self.env = previous_env
-        self.env.define(name, func, return_type)
 
-        self.builder = previous_builder
+        if previous_block is not None:
+            self.builder.position_at_end(previous_block)
+
+    def __collect_assigned_names(self, body: BlockStatement) -> set[str]:
+        """ Walks a function body and returns every name that is written to — by an
+        assignment, a postfix ++/--, or a let (which may rebind a parameter).
+        Parameters outside this set are never mutated and can stay in SSA form. """
+        assigned: set[str] = set()
+        work: list[Node] = list(body.statements)
+
+        while work:
+            current = work.pop()
+            match current.type:
+                case NodeType.AssignStatement:
+                    assigned.add(current.ident.value)
+                    work.append(current.right_value)
+                case NodeType.PostfixExpression:
+                    assigned.add(current.left_node.value)
+                case NodeType.LetStatement:
+                    assigned.add(current.name.value)
+                    work.append(current.value)
+                case NodeType.ExpressionStatement:
+                    work.append(current.expr)
+                case NodeType.BlockStatement:
+                    work.extend(current.statements)
+                case NodeType.IfStatement:
+                    work.append(current.condition)
+                    work.append(current.consequence)
+                    if current.alternative is not None:
+                        work.append(current.alternative)
+                case NodeType.WhileStatement:
+                    work.append(current.condition)
+                    work.append(current.body)
+                case NodeType.ForStatement:
+                    work.append(current.initializer)
+                    work.append(current.condition)
+                    work.append(current.increment)
+                    work.append(current.body)
+                case NodeType.InfixExpression:
+                    work.append(current.left_node)
+                    work.append(current.right_node)
+                case NodeType.PrefixExpression:
+                    work.append(current.right_node)
+                case NodeType.CallExpression:
+                    work.extend(current.arguments)
+                case NodeType.ReturnStatement:
+                    work.append(current.return_value)
+
+        return assigned
 
     def __visit_assign_statement(self, node: AssignStatement) -> None:
         name: str = node.ident.value
@@ -239,19 +379,29 @@ class Compiler:
         value: Expression = node.right_value
 
 
-        if self.env.lookup(name) is None:
+        entry = self.env.lookup(name)
+        if entry is None:
             self.errors.append(f"COMPILE ERROR: Identifier {name} has not been declared before it was re-assigned.")
             return
 
         right_value, right_type = self.__resolve_value(value)
-        var_ptr, _ = self.env.lookup(name)
+        var_ptr, _ = entry
         orig_value = self.builder.load(var_ptr)
 
-        if isinstance(orig_value.type, ir.IntType) and isinstance(right_type, ir.FloatType):
-            orig_value = self.builder.sitofp(orig_value, ir.FloatType())
+        # every compound case below branches on the same int/int predicate, so
+        # compute it once; type identity suffices for these leaf llvmlite types
+        left_is_int = type(orig_value.type) is ir.IntType
+        right_is_int = type(right_type) is ir.IntType
+
+        if left_is_int and type(right_type) is ir.FloatType:
+            orig_value = self.builder.sitofp(orig_value, self._float_type)
+            left_is_int = False
 
-        if isinstance(orig_value.type, ir.FloatType) and isinstance(right_type, ir.IntType):
-            right_value = self.builder.sitofp(right_value, ir.FloatType())
+        if type(orig_value.type) is ir.FloatType and right_is_int:
+            right_value = self.builder.sitofp(right_value, self._float_type)
+            right_is_int = False
+
+        both_int = left_is_int and right_is_int
 
         value = None
         Type = None
@@ -259,31 +409,31 @@ class Compiler:
             case "=":
                 value = right_value
             case "+=":
-                if isinstance(orig_value.type, ir.IntType) and isinstance(right_type, ir.IntType):
+                if both_int:
                     value = self.builder.add(orig_value, right_value)
                 else:
-                    value = self.builder.fadd(orig_value, right_value) 
+                    value = self.builder.fadd(orig_value, right_value)
             case "-=":
-                if isinstance(orig_value.type, ir.IntType) and isinstance(right_type, ir.IntType):
+                if both_int:
                     value = self.builder.sub(orig_value, right_value)
                 else:
                     value = self.builder.fsub(orig_value, right_value)
             case "*=":
-                if isinstance(orig_value.type, ir.IntType) and isinstance(right_type, ir.IntType):
+                if both_int:
                     value = self.builder.mul(orig_value, right_value)
                 else:
                     value = self.builder.fmul(orig_value, right_value)
             case "/=":
-                if isinstance(orig_value.type, ir.IntType) and isinstance(right_type, ir.IntType):
+                if both_int:
                     value = self.builder.sdiv(orig_value, right_value)
                 else:
                     value = self.builder.fdiv(orig_value, right_value)
             case _:
                 self.errors.append(f"COMPILE ERROR: Unsupported assignment operator {operator}")
                 return
-                
-        ptr, _ = self.env.lookup(name)
-        self.builder.store(value, ptr)
+
+        self.builder.store(value, var_ptr)
+        self.__note_store(name, value)
 
             
 
@@ -410,22 +560,26 @@ class Compiler:
             # Already parsed, just compile it again in current context
             imported_program = self.global_parsed_pallets[module_name]
         else:
-            # Try multiple possible file paths
-            possible_paths = [
-                os.path.join("tests", f"{module_name}.lime"),
-                os.path.join(".", f"{module_name}.lime"),
-                f"{module_name}.lime"
-            ]
-            
-            file_path = None
-            for path in possible_paths:
-                if os.path.isfile(path):
-                    file_path = path
-                    break
-            
+            # Try multiple possible file paths, remembering the hit so later
+            # imports of the same module cost one dict lookup
+            file_path = self._module_path_cache.get(module_name)
             if file_path is None:
-                self.errors.append(f"COMPILE ERROR: Cannot find module '{module_name}' in any of these locations: {possible_paths}")
-                return
+                possible_paths = [
+                    os.path.join("tests", f"{module_name}.lime"),
+                    os.path.join(".", f"{module_name}.lime"),
+                    f"{module_name}.lime"
+                ]
+
+                for path in possible_paths:
+                    if os.path.isfile(path):
+                        file_path = path
+                        break
+
+                if file_path is None:
+                    self.errors.append(f"COMPILE ERROR: Cannot find module '{module_name}' in any of these locations: {possible_paths}")
+                    return
+
+                self._module_path_cache[module_name] = file_path
             
             try:
                 with open(file_path, "r") as f:
@@ -434,16 +588,39 @@ class Compiler:
                 self.errors.append(f"COMPILE ERROR: Failed to read module '{module_name}' from '{file_path}': {e}")
                 return
 
-            lexer = Lexer(source=source_code)
-            parser = Parser(lexer=lexer)
-            imported_program = parser.parse_program()
+            # Check the on-disk AST cache before re-lexing/re-parsing; keyed on
+            # the source hash so a stale pickle is never reused
+            source_hash = hashlib.blake2b(source_code.encode("utf8")).hexdigest()[:16]
+            cache_path = os.path.join(self.AST_CACHE_DIR, f"{module_name}.{source_hash}.ast.pkl")
+
+            imported_program = None
+            if os.path.isfile(cache_path):
+                try:
+                    with open(cache_path, "rb") as f:
+                        imported_program = pickle.load(f)
+                except Exception:
+                    # corrupt or incompatible cache entry; fall back to parsing
+                    imported_program = None
+
+            if imported_program is None:
+                lexer = Lexer(source=source_code)
+                parser = Parser(lexer=lexer)
+                imported_program = parser.parse_program()
+
+                if len(parser.errors) > 0:
+                    self.errors.append(f"COMPILE ERROR: Errors encountered while parsing module '{module_name}':")
+                    for err in parser.errors:
+                        self.errors.append(f"\t{err}")
+                    return
+
+                try:
+                    os.makedirs(self.AST_CACHE_DIR, exist_ok=True)
+                    with open(cache_path, "wb") as f:
+                        pickle.dump(imported_program, f)
+                except Exception:
+                    # caching is best-effort; the parse already succeeded
+                    pass
 
-            if len(parser.errors) > 0:
-                self.errors.append(f"COMPILE ERROR: Errors encountered while parsing module '{module_name}':")
-                for err in parser.errors:
-                    self.errors.append(f"\t{err}")
-                return
-            
             # Cache the parsed program
             self.global_parsed_pallets[module_name] = imported_program
         
@@ -452,83 +629,271 @@ class Compiler:
     # end region statement visit methods
 
     # region expression visit methods
-    def __visit_infix_expression(self, node: InfixExpression) -> None:
-        operator: str = node.operator
-        left_value, left_type = self.__resolve_value(node.left_node)
-        right_value, right_type = self.__resolve_value(node.right_node)
-
-        value = None
-        Type = None
-        if isinstance(left_type, ir.IntType) and isinstance(right_type, ir.IntType):
-            Type = self.type_map["int"]
+    def __fold_constant_op(self, operator: str, left: int | float, right: int | float) -> int | float | None:
+        """ Applies one infix operator to two Python values, matching the semantics of
+        the LLVM instructions the runtime path would emit. Returns None when the
+        result cannot be folded safely. """
+        # Only fold when both sides are the same numeric kind, mirroring
+        # the int/int and float/float branches of the runtime codegen
+        if isinstance(left, int) != isinstance(right, int):
+            return None
+
+        try:
             match operator:
                 case "+":
-                    value = self.builder.add(left_value, right_value)
+                    result = left + right
                 case "-":
-                    value = self.builder.sub(left_value, right_value)
+                    result = left - right
                 case "*":
-                    value = self.builder.mul(left_value, right_value)
+                    result = left * right
                 case "/":
-                    value = self.builder.sdiv(left_value, right_value)
+                    if right == 0:
+                        return None
+                    # sdiv truncates towards zero, unlike Python's floor division
+                    result = math.trunc(left / right) if isinstance(left, int) else left / right
                 case "%":
-                    value = self.builder.srem(left_value, right_value)
+                    if right == 0:
+                        return None
+                    # srem keeps the sign of the dividend
+                    result = left - math.trunc(left / right) * right if isinstance(left, int) else math.fmod(left, right)
                 case "^":
-                    # TODO
-                    pass
-                case "<":
-                    value = self.builder.icmp_signed("<", left_value, right_value)
-                    Type = ir.IntType(1)
-                case "<=":
-                    value = self.builder.icmp_signed("<=", left_value, right_value)
-                    Type = ir.IntType(1)
-                case ">":
-                    value = self.builder.icmp_signed(">", left_value, right_value)
-                    Type = ir.IntType(1)
-                case ">=":
-                    value = self.builder.icmp_signed(">=", left_value, right_value)
-                    Type = ir.IntType(1)
-                case "==":
-                    value = self.builder.icmp_signed("==", left_value, right_value)
-                    Type = ir.IntType(1)
-                case "!=":
-                    value = self.builder.icmp_signed("!=", left_value, right_value)
-                    Type = ir.IntType(1)
-                
+                    if isinstance(left, int) and (right < 0 or right > 32):
+                        return None
+                    result = left ** right
+                case _:
+                    return None
+        except (OverflowError, ValueError, ZeroDivisionError):
+            return None
+
+        # a negative float base with a fractional exponent yields a complex
+        # number in Python; the runtime llvm.pow path produces NaN, so leave
+        # anything that is not a plain int/float to the runtime
+        if not isinstance(result, (int, float)):
+            return None
+
+        # Skip folding results that would not fit an i32; let the runtime wrap instead
+        if isinstance(result, int) and not -(2 ** 31) <= result < 2 ** 31:
+            return None
+
+        return result
+
+    def __fold_constant_values(self, operator: str, left_value: ir.Constant, right_value: ir.Constant) -> tuple[ir.Constant, ir.Type] | None:
+        """ Folds one operator applied to two ir.Constant operands. Returns the folded
+        (constant, type) pair, or None when the fold is unsafe. """
+        lc, rc = left_value.constant, right_value.constant
+        if not isinstance(lc, (int, float)) or not isinstance(rc, (int, float)):
+            return None
+
+        cmp = self._CMP_FUNCS.get(operator)
+        if cmp is not None:
+            # fcmp_ordered is false on NaN operands regardless of operator;
+            # Python's != is not, so leave NaN comparisons to the runtime
+            if (isinstance(lc, float) and math.isnan(lc)) or (isinstance(rc, float) and math.isnan(rc)):
+                return None
+            return ir.Constant(self._bool_type, int(cmp(lc, rc))), self._bool_type
+
+        # arithmetic folding only applies to the i32/float value domains
+        if left_value.type != right_value.type or left_value.type not in (self._int_type, self._float_type):
+            return None
+
+        result = self.__fold_constant_op(operator, lc, rc)
+        if result is None:
+            return None
+
+        Type = self._int_type if isinstance(result, int) else self._float_type
+        return ir.Constant(Type, result), Type
+
+    def __fold_identity_op(self, operator: str, left_value: ir.Value, Type: ir.Type, right_value: ir.Value) -> tuple[ir.Value, ir.Type] | None:
+        """ Elides instructions whose result equals one of their operands. Floats only
+        get the exact identities (*1.0, /1.0); x+0.0 would flip the sign of -0.0
+        and x*0.0 is wrong for NaN/-0.0, so those stay at runtime. """
+        if Type == self._int_type:
+            if isinstance(right_value, ir.Constant):
+                rc = right_value.constant
+                if (rc == 0 and operator in ("+", "-")) or (rc == 1 and operator in ("*", "/")):
+                    return left_value, Type
+                if rc == 0 and operator == "*":
+                    return right_value, Type
+            if isinstance(left_value, ir.Constant):
+                lc = left_value.constant
+                if (lc == 0 and operator == "+") or (lc == 1 and operator == "*"):
+                    return right_value, Type
+                if lc == 0 and operator == "*":
+                    return left_value, Type
+
+        elif Type == self._float_type:
+            if isinstance(right_value, ir.Constant) and right_value.constant == 1.0 and operator in ("*", "/"):
+                return left_value, Type
+            if isinstance(left_value, ir.Constant) and left_value.constant == 1.0 and operator == "*":
+                return right_value, Type
+
+        return None
+
+    def __fold_constant_node(self, node: Expression) -> int | float | None:
+        """ Evaluates a constant expression subtree in Python with an explicit stack.
+        Returns the computed value if every leaf is an Integer/Float literal,
+        otherwise None. """
+        RESOLVE, APPLY = 0, 1
+        work: list[tuple[int, Expression]] = [(RESOLVE, node)]
+        values: list[int | float] = []
+
+        while work:
+            state, current = work.pop()
+            if state == RESOLVE:
+                match current.type:
+                    case NodeType.IntegerLiteral | NodeType.FloatLiteral:
+                        values.append(current.value)
+                    case NodeType.InfixExpression:
+                        work.append((APPLY, current))
+                        work.append((RESOLVE, current.right_node))
+                        work.append((RESOLVE, current.left_node))
+                    case _:
+                        return None
+            else:
+                right = values.pop()
+                left = values.pop()
+                result = self.__fold_constant_op(current.operator, left, right)
+                if result is None:
+                    return None
+                values.append(result)
+
+        return values[0]
+
+    def __group_assoc_constants(self, node: InfixExpression) -> InfixExpression:
+        """ Regroups integer constant chains of associative operators so only one IR
+        instruction is emitted: (x + c1) + c2 becomes x + (c1+c2), likewise for *,
+        and (x - c1) - c2 becomes x - (c1+c2). """
+        operator: str = node.operator
+        if operator not in ("+", "-", "*"):
+            return node
+
+        # successive subtractions accumulate their constants additively
+        fold_op: str = "+" if operator == "-" else operator
+
+        while (node.right_node.type == NodeType.IntegerLiteral
+               and node.left_node.type == NodeType.InfixExpression
+               and node.left_node.operator == operator
+               and node.left_node.right_node.type == NodeType.IntegerLiteral):
+            folded = self.__fold_constant_op(fold_op, node.left_node.right_node.value, node.right_node.value)
+            if folded is None:
+                break
+
+            node = InfixExpression(
+                left_node=node.left_node.left_node,
+                operator=operator,
+                right_node=IntegerLiteral(value=folded)
+            )
+
+        return node
+
+    def __try_const_fold(self, node: InfixExpression) -> tuple[ir.Constant, ir.Type] | None:
+        """ Attempts to collapse a fully-constant infix subtree into a single ir.Constant. """
+        value = self.__fold_constant_node(node)
+        if value is None:
+            return None
+
+        Type = self._int_type if isinstance(value, int) else self._float_type
+        return ir.Constant(Type, value), Type
+
+    def __visit_infix_expression(self, node: InfixExpression) -> tuple[ir.Value, ir.Type]:
+        # Post-order worklist with an explicit value stack, so deeply nested
+        # expression chains do not cost one Python frame per operator
+        RESOLVE, EMIT = 0, 1
+        work: list[tuple[int, Expression]] = [(RESOLVE, node)]
+        values: list[tuple[ir.Value, ir.Type]] = []
+
+        # hoist the loop-invariant bound methods to locals; this loop runs
+        # once per operator and operand in the expression
+        push_work = work.append
+        push_value = values.append
+        try_fold = self.__try_const_fold
+        group = self.__group_assoc_constants
+        resolve = self.__resolve_value
+        emit = self.__emit_infix_op
+        infix_type = NodeType.InfixExpression
+
+        while work:
+            state, current = work.pop()
+            if state == RESOLVE:
+                if current.type is infix_type:
+                    folded = try_fold(current)
+                    if folded is not None:
+                        push_value(folded)
+                        continue
+
+                    current = group(current)
+
+                    # emit this operator once both operands have been resolved
+                    push_work((EMIT, current))
+                    push_work((RESOLVE, current.right_node))
+                    push_work((RESOLVE, current.left_node))
+                else:
+                    push_value(resolve(current))
+            else:
+                right_value, right_type = values.pop()
+                left_value, left_type = values.pop()
+                push_value(emit(current.operator, left_value, left_type, right_value, right_type))
+
+        return values[0]
+
+    def __emit_infix_op(self, operator: str, left_value: ir.Value, left_type: ir.Type, right_value: ir.Value, right_type: ir.Type) -> tuple[ir.Value, ir.Type]:
+        # Fold at the value level when both operands are already constants,
+        # which catches cases the AST-level fold cannot see (regrouped chains,
+        # comparisons, folded subtrees meeting a literal)
+        if isinstance(left_value, ir.Constant) and isinstance(right_value, ir.Constant):
+            folded = self.__fold_constant_values(operator, left_value, right_value)
+            if folded is not None:
+                return folded
+
+        # identity/absorbing-element peepholes: x+0, x-0, x*1, x/1, x*0, ...
+        if left_type == right_type:
+            peephole = self.__fold_identity_op(operator, left_value, left_type, right_value)
+            if peephole is not None:
+                return peephole
+
+        # comparisons bottleneck through one call site: pick icmp vs fcmp off
+        # the operand kind, result type is always bool
+        if operator in self._COMPARISON_OPS:
+            if isinstance(left_type, ir.FloatType) and isinstance(right_type, ir.FloatType):
+                return self._fcmp_ordered(operator, left_value, right_value), self._bool_type
+            if isinstance(left_type, ir.IntType) and isinstance(right_type, ir.IntType):
+                return self._icmp_signed(operator, left_value, right_value), self._bool_type
+            return None, None
+
+        value = None
+        Type = None
+        if isinstance(left_type, ir.IntType) and isinstance(right_type, ir.IntType):
+            if operator == "^":
+                # small constant exponents expand to straight-line multiplies
+                # instead of the counter loop and its three blocks
+                if isinstance(right_value, ir.Constant) and isinstance(right_value.constant, int) and 0 <= right_value.constant <= 8:
+                    value = self.__emit_small_int_pow(left_value, right_value.constant)
+                else:
+                    value = self.__emit_int_pow(left_value, right_value)
+                Type = self._int_type
+            else:
+                if operator == "*":
+                    # multiply by a constant power of two lowers to shl; sdiv
+                    # and srem keep their real ops, since ashr/and round the
+                    # wrong way for negative operands
+                    value = self.__emit_strength_reduced_mul(left_value, right_value)
+                if value is None:
+                    emit = self._infix_ops.get((ir.IntType, operator))
+                    if emit is not None:
+                        value = emit(left_value, right_value)
+                if value is not None:
+                    Type = self._int_type
 
         elif isinstance(left_type, ir.FloatType) and isinstance(right_type, ir.FloatType):
-            Type = ir.FloatType()
-            match operator:
-                case "+":
-                    value = self.builder.fadd(left_value, right_value)
-                case "-":
-                    value = self.builder.fsub(left_value, right_value)
-                case "*":
-                    value = self.builder.fmul(left_value, right_value)
-                case "/":
-                    value = self.builder.fdiv(left_value, right_value)
-                case "%":
-                    value = self.builder.frem(left_value, right_value)
-                case "^":
-                    # TODO
-                    pass
-                case "<":
-                    value = self.builder.fcmp_ordered("<", left_value, right_value)
-                    Type = ir.IntType(1)
-                case "<=":
-                    value = self.builder.fcmp_ordered("<=", left_value, right_value)
-                    Type = ir.IntType(1)
-                case ">":
-                    value = self.builder.fcmp_ordered(">", left_value, right_value)
-                    Type = ir.IntType(1)
-                case ">=":
-                    value = self.builder.fcmp_ordered(">=", left_value, right_value)
-                    Type = ir.IntType(1)
-                case "==":
-                    value = self.builder.fcmp_ordered("==", left_value, right_value)
-                    Type = ir.IntType(1)
-                case "!=":
-                    value = self.builder.fcmp_ordered("!=", left_value, right_value)
-                    Type = ir.IntType(1)
+            if operator == "^":
+                pow_fn = self._get_intrinsic("llvm.pow", [self._float_type])
+                value = self.builder.call(pow_fn, [left_value, right_value])
+                Type = self._float_type
+            else:
+                emit = self._infix_ops.get((ir.FloatType, operator))
+                if emit is not None:
+                    value = emit(left_value, right_value)
+                    Type = self._float_type
 
         return value, Type
     
@@ -536,18 +901,15 @@ class Compiler:
         name: str = node.function.value
         params: list[Expression] = node.arguments
 
-        args = []
-        types = []
-
-        if len(params) > 0:
-            for x in params:
-                p_val, p_type = self.__resolve_value(x)
-                args.append(p_val)
-                types.append(p_type)
+        # resolve all arguments in one pass and split values/types with zip
+        if params:
+            args, types = map(list, zip(*(self.__resolve_value(x) for x in params)))
+        else:
+            args, types = [], []
         match name:
             case "printf":
                 ret = self.builtin_printf(params=args, return_type=types[0])
-                ret_type = self.type_map["int"]
+                ret_type = self._int_type
             case _:
                 func, ret_type = self.env.lookup(name)
                 ret = self.builder.call(func, args)
@@ -563,20 +925,31 @@ class Compiler:
         Type = None
         value = None
         if isinstance(right_type, ir.FloatType):
-            Type = ir.FloatType()
+            Type = self._float_type
             match operator:
                 case "-":
-                    value = self.builder.fmul(right_value, ir.Constant(ir.FloatType(), -1.0))
+                    value = self.builder.fmul(right_value, ir.Constant(self._float_type, -1.0))
                 case "!":
-                    value = ir.Constant(ir.IntType(1), 0)
-            
+                    # a float is falsy exactly when it equals 0.0; ordered
+                    # compare also makes !NaN false, matching NaN truthiness
+                    value = self._fcmp_ordered("==", right_value, ir.Constant(self._float_type, 0.0))
+                    Type = self._bool_type
+
         elif isinstance(right_type, ir.IntType):
-            Type = ir.IntType(32)
+            Type = self._int_type
             match operator:
                 case "-":
-                    value = self.builder.mul(right_value, ir.Constant(ir.IntType(32), -1))
+                    value = self.builder.mul(right_value, ir.Constant(self._int_type, -1))
                 case "!":
-                    value = self.builder.not_(right_value)    
+                    if right_type.width == 1:
+                        # already a bool; flipping the bit is the negation
+                        value = self.builder.not_(right_value)
+                        Type = self._bool_type
+                    else:
+                        # an int is falsy exactly when it equals 0; bitwise
+                        # not_ would hand an i32 to conditional branches
+                        value = self.builder.icmp_signed("==", right_value, ir.Constant(self._int_type, 0))
+                        Type = self._bool_type
 
         return value, Type
     
@@ -598,23 +971,24 @@ class Compiler:
         match operator:
             case "++":
                 if isinstance(orig_value.type, ir.IntType):
-                    new_value = self.builder.add(orig_value, ir.Constant(ir.IntType(32), 1))
+                    new_value = self.builder.add(orig_value, ir.Constant(self._int_type, 1))
                 elif isinstance(orig_value.type, ir.FloatType):
-                    new_value = self.builder.fadd(orig_value, ir.Constant(ir.FloatType(), 1.0))
+                    new_value = self.builder.fadd(orig_value, ir.Constant(self._float_type, 1.0))
                 else:
                     self.errors.append(f"COMPILE ERROR: Unsupported type for ++ operator on identifier {left_node.value}")
                     return None, None
             case "--":
                 if isinstance(orig_value.type, ir.IntType):
-                    new_value = self.builder.sub(orig_value, ir.Constant(ir.IntType(32), 1))
+                    new_value = self.builder.sub(orig_value, ir.Constant(self._int_type, 1))
                 elif isinstance(orig_value.type, ir.FloatType):
-                    new_value = self.builder.fsub(orig_value, ir.Constant(ir.FloatType(), 1.0))
+                    new_value = self.builder.fsub(orig_value, ir.Constant(self._float_type, 1.0))
                 else:
                     self.errors.append(f"COMPILE ERROR: Unsupported type for -- operator on identifier {left_node.value}")
                     return None, None
                 
         # Store the new value back to the variable
         self.builder.store(new_value, var_ptr)
+        self.__note_store(left_node.value, new_value)
         
         # Return the original value (postfix semantics)
         return result_value, var_type
@@ -625,70 +999,202 @@ class Compiler:
 
     # region helper methods
     def __resolve_value(self, node: Expression) -> tuple[ir.Value, ir.Type]:
-        match node.type():
-            case NodeType.IntegerLiteral:
-                node: IntegerLiteral = node
-                value, Type = node.value, self.type_map["int"]
-                return ir.Constant(Type, value), Type
-            
-            case NodeType.FloatLiteral:
-                node: FloatLiteral = node
-                value, Type = node.value, self.type_map["float"]
-                return ir.Constant(Type, value), Type
-            
-            case NodeType.IdentifierLiteral:
-                node: IdentifierLiteral = node
-                ptr, Type = self.env.lookup(node.value)
-                return self.builder.load(ptr), Type
-            
-            case NodeType.BooleanLiteral:
-                node: BooleanLiteral = node
-                value = 1 if node.value else 0
-                Type = ir.IntType(1)
-                return ir.Constant(Type, value), Type
-            
-            case NodeType.StringLiteral:
-                node: StringLiteral = node
-                string, Type = self.__convert_string(node.value)
-                return string, Type
-
-            # Expression Values
-            case NodeType.InfixExpression:
-                return self.__visit_infix_expression(node) 
-            case NodeType.CallExpression:
-                return self.__visit_call_expression(node)
-            case NodeType.PrefixExpression:
-                return self.__visit_prefix_expression(node)
-            case NodeType.PostfixExpression:
-                return self.__visit_postfix_expression(node)
-
+        return self._resolve_dispatch[node.type](node)
+
+    def __resolve_integer_literal(self, node: IntegerLiteral) -> tuple[ir.Value, ir.Type]:
+        # literal nodes memoize their resolved pair, so re-compiling the same
+        # AST (cached imports) skips constant construction entirely
+        memo = getattr(node, "_ir_const", None)
+        if memo is not None:
+            return memo
+
+        value, Type = node.value, self._int_type
+        if -5 <= value < 257:
+            cached = self._small_int_consts[value + 5]
+        else:
+            cached = self._const_cache.get(("int", value))
+            if cached is None:
+                cached = self._const_cache.setdefault(("int", value), ir.Constant(Type, value))
+
+        memo = (cached, Type)
+        node._ir_const = memo
+        return memo
+
+    def __resolve_float_literal(self, node: FloatLiteral) -> tuple[ir.Value, ir.Type]:
+        memo = getattr(node, "_ir_const", None)
+        if memo is not None:
+            return memo
+
+        value, Type = node.value, self._float_type
+        cached = self._const_cache.get(("float", value))
+        if cached is None:
+            cached = self._const_cache.setdefault(("float", value), ir.Constant(Type, value))
+
+        memo = (cached, Type)
+        node._ir_const = memo
+        return memo
+
+    def __resolve_identifier_literal(self, node: IdentifierLiteral) -> tuple[ir.Value, ir.Type]:
+        ptr, Type = self.env.lookup(node.value)
+        # read-only parameters are bound to their SSA argument, not a slot
+        if isinstance(ptr, ir.Argument):
+            return ptr, Type
+        return self.__cached_load(node.value, ptr), Type
+
+    def __resolve_boolean_literal(self, node: BooleanLiteral) -> tuple[ir.Value, ir.Type]:
+        return (self._const_true if node.value else self._const_false), self._bool_type
+
+    def __resolve_string_literal(self, node: StringLiteral) -> tuple[ir.Value, ir.Type]:
+        string, Type = self.__convert_string(node.value)
+        return string, Type
+
+
+    def _make_const_global(self, Type: ir.Type, init: ir.Constant, name: str) -> ir.GlobalVariable:
+        """ Creates an internal constant global in one place, so the three attribute
+        sets happen at a single site. """
+        g = ir.GlobalVariable(self.module, Type, name=name)
+        g.linkage = 'internal'
+        g.global_constant = True
+        g.initializer = init
+        return g
+
+    def _get_intrinsic(self, name: str, sig: list[ir.Type]) -> ir.Function:
+        """ Declares an intrinsic on first use and reuses that declaration afterwards. """
+        fn = self._intrinsic_cache.get(name)
+        if fn is None:
+            fn = self._intrinsic_cache.setdefault(name, self.module.declare_intrinsic(name, sig))
+        return fn
 
     def __convert_string(self, string: str) -> tuple[ir.Constant, ir.ArrayType]:
         if string is None:
             string = ""
-        
-        string = string.replace("\\n", "\n\0")
 
-        fmt : str = f"{string}\0"
-        c_fmt: ir.Constant = ir.Constant(ir.ArrayType(ir.IntType(8), len(fmt)), bytearray(fmt.encode("utf8")))
+        # translate the escape and terminate with a single trailing NUL; the
+        # old replacement embedded a NUL after every newline, truncating
+        # printf output mid-string
+        encoded: bytes = string.replace("\\n", "\n").encode("utf8") + b"\0"
+
+        # identical string literals share one global
+        global_fmt = self._str_globals.get(encoded)
+        if global_fmt is not None:
+            return global_fmt, global_fmt.type
+
+        c_fmt: ir.Constant = ir.Constant(ir.ArrayType(ir.IntType(8), len(encoded)), bytearray(encoded))
+
+        global_fmt = self._make_const_global(c_fmt.type, c_fmt, f"__str_{self.__increment_counter()}")
+
+        self._str_globals[encoded] = global_fmt
 
-        global_fmt = ir.GlobalVariable(self.module, c_fmt.type, name=f"__str_{self.__increment_counter()}")
-        global_fmt.linkage = 'internal'
-        global_fmt.global_constant = True
-        global_fmt.initializer = c_fmt
-        
         return global_fmt, global_fmt.type
 
+    def __emit_small_int_pow(self, base: ir.Value, exponent: int) -> ir.Value:
+        """ Expands `base ^ exponent` for a small constant exponent into a chain
+        of multiplies, with x^0 folding straight to 1. """
+        if exponent == 0:
+            return ir.Constant(self._int_type, 1)
+
+        value = base
+        for _ in range(exponent - 1):
+            value = self.builder.mul(value, base)
+        return value
+
+    def __emit_strength_reduced_mul(self, left_value: ir.Value, right_value: ir.Value) -> ir.Value | None:
+        """ Lowers multiplication by a constant power of two to a left shift.
+        Returns None when neither operand qualifies. """
+        for const, other in ((right_value, left_value), (left_value, right_value)):
+            if isinstance(const, ir.Constant):
+                c = const.constant
+                if isinstance(c, int) and c >= 2 and (c & (c - 1)) == 0:
+                    return self.builder.shl(other, ir.Constant(self._int_type, c.bit_length() - 1))
+        return None
+
+    def __emit_int_pow(self, base: ir.Value, exponent: ir.Value) -> ir.Value:
+        """ Emits an integer exponentiation loop (result *= base, exponent times).
+        Exponents <= 0 yield 1. """
+        int_type: ir.Type = self._int_type
+
+        result_ptr = self.__alloca(int_type)
+        self.builder.store(ir.Constant(int_type, 1), result_ptr)
+
+        counter_ptr = self.__alloca(int_type)
+        self.builder.store(ir.Constant(int_type, 0), counter_ptr)
+
+        pow_loop_condition = self.builder.append_basic_block(f"pow_loop_condition_{self.__increment_counter()}")
+        pow_loop_body = self.builder.append_basic_block(f"pow_loop_body_{self.counter}")
+        pow_loop_end = self.builder.append_basic_block(f"pow_loop_end_{self.counter}")
+
+        self.builder.branch(pow_loop_condition)
+
+        # Condition check block
+        self.builder.position_at_start(pow_loop_condition)
+        counter = self.builder.load(counter_ptr)
+        test = self.builder.icmp_signed("<", counter, exponent)
+        self.builder.cbranch(test, pow_loop_body, pow_loop_end)
+
+        # Loop body block
+        self.builder.position_at_start(pow_loop_body)
+        result = self.builder.load(result_ptr)
+        self.builder.store(self.builder.mul(result, base), result_ptr)
+        counter = self.builder.load(counter_ptr)
+        self.builder.store(self.builder.add(counter, ir.Constant(int_type, 1)), counter_ptr)
+        self.builder.branch(pow_loop_condition)
+
+        # End block
+        self.builder.position_at_start(pow_loop_end)
+        return self.builder.load(result_ptr)
+
+    def __cached_load(self, name: str, ptr: ir.Value) -> ir.Value:
+        """ Loads an identifier, reusing the previous load if nothing stored to it
+        since and the builder is still in the same basic block. """
+        block = self.builder.block
+        if block is not self._id_cache_block:
+            self._id_value_cache = {}
+            self._id_cache_block = block
+
+        value = self._id_value_cache.get(name)
+        if value is None:
+            value = self.builder.load(ptr)
+            self._id_value_cache[name] = value
+        return value
+
+    def __invalidate_cached_load(self, name: str) -> None:
+        self._id_value_cache.pop(name, None)
+
+    def __note_store(self, name: str, value: ir.Value) -> None:
+        """ Records the value just stored to an identifier, so a following load in the
+        same block reuses it instead of emitting a LoadInstr. """
+        block = self.builder.block
+        if block is not self._id_cache_block:
+            self._id_value_cache = {}
+            self._id_cache_block = block
+        self._id_value_cache[name] = value
+
+    def __slot_for(self, name: str, Type: ir.Type) -> ir.Value:
+        """ Returns the stack slot for a (scope, name, type) binding, allocating it in
+        the entry block the first time that combination is seen. """
+        key = (self.env, name, Type)
+        ptr = self._slot_cache.get(key)
+        if ptr is None:
+            ptr = self.__alloca(Type)
+            self._slot_cache[key] = ptr
+        return ptr
+
+    def __alloca(self, Type: ir.Type) -> ir.Value:
+        """ Allocates a stack slot at the top of the current function's entry block so
+        mem2reg can promote it, no matter which block the builder is emitting into. """
+        if self.builder.block is None:
+            return self.builder.alloca(Type)
+
+        with self.builder.goto_entry_block():
+            return self.builder.alloca(Type)
+
     def __increment_counter(self) -> int:
         self.counter += 1
         return self.counter
 
     def builtin_printf(self, params: list[ir.Instruction], return_type: ir.Type) -> None:
         """Basic C builtin printf function. Takes in a list of parameters and the return type, and returns the result of calling printf with the given parameters."""
-        func, _ = self.env.lookup("printf")
-        
-        c_str = self.builder.alloca(return_type)
-        self.builder.store(params[0], c_str)
+        func = self._printf_func
 
         rest_params = params[1:]
 
@@ -699,13 +1205,13 @@ class Compiler:
             c_fmt: ir.LoadInstr = params[0]
             g_var_ptr = c_fmt.operands[0]
             string_val = self.builder.load(g_var_ptr)
-            fmt_arg = self.builder.bitcast(string_val, ir.IntType(8).as_pointer())
+            fmt_arg = self.builder.bitcast(string_val, self._str_type)
             return self.builder.call(func, [fmt_arg, *rest_params])
         else:
             """ Printing from a normal string declared within printf """
             # printf("yeet %i", 23)
             # TODO: Handle PRINTING FLOATS
-            fmt_arg = self.builder.bitcast(params[0], ir.IntType(8).as_pointer())
+            fmt_arg = self.builder.bitcast(params[0], self._str_type)
 
             return self.builder.call(func, [fmt_arg, *rest_params])
 
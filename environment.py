@@ -16,14 +16,14 @@ class Environment:
     def define(self, name: str, ptr: ir.Value, _type: ir.Type) -> ir.Value:
         self.records[name] = (ptr, _type)
         return ptr
-    
-    def lookup(self, name: str) -> Optional[tuple[ir.Value, ir.Type]]:
-        return self.__resolve(name)
 
-    def __resolve(self, name: str) -> Optional[tuple[ir.Value, ir.Type]]:
-        if name in self.records:
-            return self.records[name]
-        elif self.parent:
-            return self.parent.__resolve(name)
-        else:
-            return None
\ No newline at end of file
+    def lookup(self, name: str) -> Optional[tuple[ir.Value, ir.Type]]:
+        # walk the scope chain iteratively; one dict probe per scope with no
+        # Python call frame per level
+        env = self
+        while env is not None:
+            entry = env.records.get(name)
+            if entry is not None:
+                return entry
+            env = env.parent
+        return None
@@ -35,45 +35,49 @@ class NodeType(Enum):
     FunctionParameter = "FunctionParameter"
 
 class Node(ABC):
-    @abstractmethod
-    def type(self) -> NodeType:
-        pass
+    # the whole hierarchy is slotted so nodes carry no per-instance dict;
+    # every subclass lists exactly the fields its __init__ assigns
+    __slots__ = ()
+
+    # each subclass sets this once; an attribute load is cheaper than a
+    # method call in the compiler's dispatch hot paths
+    type: NodeType
 
     @abstractmethod
     def json(self) -> dict:
         pass
 
 class Statement(Node):
-    pass
+    __slots__ = ()
 
 class Expression(Node):
-    pass
+    __slots__ = ()
 
 class Program(Node):
+    __slots__ = ("statements",)
     def __init__(self) -> None:
         self.statements: list[Statement] = []
 
-    def type(self) -> NodeType:
-        return NodeType.Program
+    type = NodeType.Program
 
     def json(self) -> dict:
         return {
-            "type": self.type().value,
-            "statements": [{stmt.type().value: stmt.json()} for stmt in self.statements]
+            "type": self.type.value,
+            "statements": [{stmt.type.value: stmt.json()} for stmt in self.statements]
         }
     
 # region helpers
 class FunctionParameter(Expression):
+    __slots__ = ("name", "value_type")
     def __init__(self, name: str, value_type: str = None) -> None:
         self.name = name
         self.value_type = value_type
 
-    def type(self) -> NodeType:
-        return NodeType.FunctionParameter
+    type = NodeType.FunctionParameter
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "name": self.name,
             "value_type": self.value_type
         }
@@ -81,74 +85,74 @@ class FunctionParameter(Expression):
     
 # region statements
 class ExpressionStatement(Statement):
+    __slots__ = ("expr",)
     def __init__(self, expr: Expression = None) -> None:
         self.expr: Expression = expr
 
-    def type(self) -> NodeType:
-        return NodeType.ExpressionStatement
+    type = NodeType.ExpressionStatement
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "expr": self.expr.json()
         }
 
 class LetStatement(Statement):
+    __slots__ = ("name", "value", "value_type")
     def __init__(self, name: Expression = None, value: Expression = None, value_type: str = None) -> None:
         self.name: Expression = name
         self.value: Expression = value
         self.value_type: str = value_type
 
-    def type(self) -> NodeType:
-        return NodeType.LetStatement
+    type = NodeType.LetStatement
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "name": self.name.json(),
             "value": self.value.json(),
             "value_type": self.value_type
         }
     
 class BlockStatement(Statement):
+    __slots__ = ("statements",)
     def __init__(self, statements: list[Statement] = None) -> None:
         self.statements = statements if statements is not None else []
 
-    def type(self) -> NodeType:
-        return NodeType.BlockStatement
+    type = NodeType.BlockStatement
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "statements": [stmt.json() for stmt in self.statements]
         }
     
 class ReturnStatement(Statement):
+    __slots__ = ("return_value",)
     def __init__(self, return_value: Expression = None) -> None:
         self.return_value = return_value
 
-    def type(self) -> NodeType:
-        return NodeType.ReturnStatement
+    type = NodeType.ReturnStatement
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "return_value": self.return_value.json()
         }
 
 class FunctionStatement(Statement):
+    __slots__ = ("parameters", "body", "name", "return_type")
     def __init__(self, parameters: list[FunctionParameter] = [], body: BlockStatement = None, name = None, return_type: str = None) -> None:
         self.parameters = parameters
         self.body = body
         self.name = name
         self.return_type = return_type
 
-    def type(self) -> NodeType:
-        return NodeType.FunctionStatement
+    type = NodeType.FunctionStatement
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "name": self.name.json(),
             "return_type": self.return_type,
             "parameters": [param.json() for param in self.parameters],
@@ -156,75 +160,75 @@ class FunctionStatement(Statement):
         }
     
 class AssignStatement(Statement):
+    __slots__ = ("ident", "operator", "right_value")
     def __init__(self,  ident: Expression = None, operator: str = None, right_value: Expression = None) -> None:
         self.ident = ident
         self.operator = operator
         self.right_value = right_value
 
-    def type(self) -> NodeType:
-        return NodeType.AssignStatement
+    type = NodeType.AssignStatement
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "ident": self.ident.json(),
             "right_value": self.right_value.json()
         }
     
 class IfStatement(Statement):
+    __slots__ = ("condition", "consequence", "alternative")
     def __init__(self, condition: Expression = None, consequence: BlockStatement = None, alternative: BlockStatement = None) -> None:
         self.condition = condition
         self.consequence = consequence
         self.alternative = alternative
 
-    def type(self) -> NodeType:
-        return NodeType.IfStatement
+    type = NodeType.IfStatement
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "condition": self.condition.json(),
             "consequence": self.consequence.json(),
             "alternative": self.alternative.json() if self.alternative is not None else None
         }
     
 class BreakStatement(Statement):
+    __slots__ = ()
     def __init__(self) -> None:
         pass
 
-    def type(self) -> NodeType:
-        return NodeType.BreakStatement
+    type = NodeType.BreakStatement
     
     def json(self) -> dict:
         return {
-            "type": self.type().value
+            "type": self.type.value
         }
     
 class ContinueStatement(Statement):
+    __slots__ = ()
     def __init__(self) -> None:
         pass
 
-    def type(self) -> NodeType:
-        return NodeType.ContinueStatement
+    type = NodeType.ContinueStatement
     
     def json(self) -> dict:
         return {
-            "type": self.type().value
+            "type": self.type.value
         }
     
 class ForStatement(Statement):
+    __slots__ = ("initializer", "condition", "increment", "body")
     def __init__(self, initializer: LetStatement = None, condition: Expression = None, increment: Expression = None, body: BlockStatement = None) -> None:
         self.initializer = initializer
         self.condition = condition
         self.increment = increment
         self.body = body
 
-    def type(self) -> NodeType:
-        return NodeType.ForStatement
+    type = NodeType.ForStatement
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "initializer": self.initializer.json(),
             "condition": self.condition.json(),
             "increment": self.increment.json(),
@@ -232,28 +236,28 @@ class ForStatement(Statement):
         }
     
 class ImportStatement(Statement):
+    __slots__ = ("module_name",)
     def __init__(self, module_name: Expression = None) -> None:
         self.module_name = module_name
 
-    def type(self) -> NodeType:
-        return NodeType.ImportStatement
+    type = NodeType.ImportStatement
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "module_name": self.module_name.json() if self.module_name else None
         }
 class WhileStatement(Statement):
+    __slots__ = ("condition", "body")
     def __init__(self, condition: Expression, body: BlockStatement = None) -> None:
         self.condition = condition
         self.body = body
 
-    def type(self) -> NodeType:
-        return NodeType.WhileStatement
+    type = NodeType.WhileStatement
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "condition": self.condition.json(),
             "body": self.body.json()
         }
@@ -261,63 +265,63 @@ class WhileStatement(Statement):
 
 # region expressions
 class InfixExpression(Expression):
+    __slots__ = ("left_node", "operator", "right_node")
     def __init__(self, left_node: Expression, operator: str, right_node: Expression = None) -> None:
         self.left_node: Expression = left_node
         self.operator: str = operator
         self.right_node: Expression = right_node
 
-    def type(self) -> NodeType:
-        return NodeType.InfixExpression
+    type = NodeType.InfixExpression
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "left_node": self.left_node.json(),
             "operator": self.operator,
             "right_node": self.right_node.json()
         }
     
 class CallExpression(Expression):
+    __slots__ = ("function", "arguments")
     def __init__(self, function: Expression = None, arguments: list[Expression] = None) -> None:
         self.function = function # IdentifierLiteral
         self.arguments = arguments
 
-    def type(self) -> NodeType:
-        return NodeType.CallExpression
+    type = NodeType.CallExpression
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "function": self.function.json(),
             "arguments": [arg.json() for arg in self.arguments]
         }
     
 class PrefixExpression(Expression):
+    __slots__ = ("operator", "right_node")
     def __init__(self, operator: str, right_node: Expression = None) -> None:
         self.operator = operator
         self.right_node = right_node
 
-    def type(self) -> NodeType:
-        return NodeType.PrefixExpression
+    type = NodeType.PrefixExpression
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "operator": self.operator,
             "right_node": self.right_node.json()
         }
     
 class PostfixExpression(Expression):
+    __slots__ = ("left_node", "operator")
     def __init__(self, left_node: Expression = None, operator: str = None) -> None:
         self.operator = operator
         self.left_node = left_node
 
-    def type(self) -> NodeType:
-        return NodeType.PostfixExpression
+    type = NodeType.PostfixExpression
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "operator": self.operator,
             "left_node": self.left_node.json()
         }
@@ -325,67 +329,69 @@ class PostfixExpression(Expression):
 
 # region literals
 class IntegerLiteral(Expression):
+    # _ir_const holds the compiler's memoized ir.Constant for this node
+    __slots__ = ("value", "_ir_const")
     def __init__(self, value: int = None) -> None:
         self.value: int = value
 
-    def type(self) -> NodeType:
-        return NodeType.IntegerLiteral
+    type = NodeType.IntegerLiteral
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "value": self.value
         }
     
 class FloatLiteral(Expression):
+    # _ir_const holds the compiler's memoized ir.Constant for this node
+    __slots__ = ("value", "_ir_const")
     def __init__(self, value: float = None) -> None:
         self.value: float = value
 
-    def type(self) -> NodeType:
-        return NodeType.FloatLiteral
+    type = NodeType.FloatLiteral
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "value": self.value
         }
     
 class IdentifierLiteral(Expression):
+    __slots__ = ("value",)
     def __init__(self, value: str = None) -> None:
         self.value: str = value
 
-    def type(self) -> NodeType:
-        return NodeType.IdentifierLiteral
+    type = NodeType.IdentifierLiteral
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "value": self.value
         }
     
 class BooleanLiteral(Expression):
+    __slots__ = ("value",)
     def __init__(self, value: bool = None) -> None:
         self.value: bool = value
 
-    def type(self) -> NodeType:
-        return NodeType.BooleanLiteral
+    type = NodeType.BooleanLiteral
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "value": self.value
         }
     
 class StringLiteral(Expression):
+    __slots__ = ("value",)
     def __init__(self, value: str = None) -> None:
         self.value: str = value
 
-    def type(self) -> NodeType:
-        return NodeType.StringLiteral
+    type = NodeType.StringLiteral
     
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "value": self.value
         }
 # endregion literals
\ No newline at end of file
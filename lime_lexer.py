@@ -1,7 +1,58 @@
 from lime_token import Token, TokenType, lookup_ident
 from typing import Any
+import re
+import sys
+
+# matches a whole run of whitespace so skipping is one C-level scan instead
+# of a Python comparison per character
+_WS_RE = re.compile(r"[ \t\r\n]+")
+
+# identifier scan, shared shape with the IDENT group of the master pattern
+_IDENT_RE = re.compile(r"[A-Za-z_]\w*")
+
+# single-character tokens indexed by ordinal, so dispatch is one table load
+# instead of a walk down the match ladder
+_SINGLE: list[TokenType | None] = [None] * 128
+for _ch, _tt in {
+    '+': TokenType.PLUS, '-': TokenType.MINUS, '*': TokenType.ASTERISK,
+    '/': TokenType.SLASH, '^': TokenType.POWER, '%': TokenType.MODULO,
+    '<': TokenType.LT, '>': TokenType.GT, '=': TokenType.EQ,
+    '!': TokenType.BANG, ':': TokenType.COLON, ',': TokenType.COMMA,
+    ';': TokenType.SEMICOLON, '(': TokenType.LPAREN, ')': TokenType.RPAREN,
+    '{': TokenType.LBRACE, '}': TokenType.RBRACE,
+}.items():
+    _SINGLE[ord(_ch)] = _tt
+
+# two-character operators, probed before the single-char table so += wins
+# over + followed by =
+_TWO_CHAR: dict[str, TokenType] = {
+    '+=': TokenType.PLUS_EQ, '++': TokenType.PLUS_PLUS,
+    '-=': TokenType.MINUS_EQ, '--': TokenType.MINUS_MINUS,
+    '->': TokenType.ARROW,
+    '*=': TokenType.MUL_EQ, '/=': TokenType.DIV_EQ,
+    '<=': TokenType.LT_EQ, '>=': TokenType.GT_EQ,
+    '==': TokenType.EQ_EQ, '!=': TokenType.NOT_EQ,
+}
+
+# one master pattern classifying every lexeme, so tokenize_all covers the
+# whole source with C-level scans; alternation order encodes the same
+# priorities next_token applies (comments before dots, pairs before singles)
+_TOKEN_RE = re.compile(r'''
+    (?P<WS>[ \t\r\n]+)
+  | (?P<COMMENT>\.\.\.(?:[\s\S]*?\.\.\.|[\s\S]*))
+  | (?P<BADNUM>\d+\.\d*(?=\.))
+  | (?P<FLOAT>\d+\.\d*)
+  | (?P<INT>\d+)
+  | (?P<IDENT>[A-Za-z_]\w*)
+  | (?P<STRING>"[^"]*"?)
+  | (?P<TWO>\+\+|\+=|--|-=|->|\*=|/=|<=|>=|==|!=)
+  | (?P<OP>[-+*/^%<>=!:,;(){}])
+  | (?P<BAD>[\s\S])
+''', re.VERBOSE)
 
 class Lexer:
+    __slots__ = ("source", "position", "read_position", "line", "current_char")
+
     def __init__(self, source: str) -> None:
         self.source = source
 
@@ -29,10 +80,15 @@ class Lexer:
             return self.source[self.read_position]
 
     def __skip_whitespace(self) -> None:
-        while self.current_char in [' ', '\t', '\n', '\r']:
-            if self.current_char == '\n':
-                self.line += 1
-            self.__read_char()
+        m = _WS_RE.match(self.source, self.position)
+        if m is None:
+            return
+
+        end = m.end()
+        self.line += self.source.count('\n', self.position, end)
+        self.position = end
+        self.read_position = end + 1
+        self.current_char = self.source[end] if end < len(self.source) else None
 
     def __new_token(self, tt: TokenType, literal: Any) -> Token:
         return Token(type=tt, literal=literal, line=self.line, position=self.position)
@@ -47,172 +103,147 @@ class Lexer:
         start_pos: int = self.position
         dot_count: int = 0
 
-        output: str = ""
+        # record the span and slice once at the end instead of growing a new
+        # string object per digit
         while self.__is_digit(self.current_char) or self.current_char == '.':
             if self.current_char == '.':
                 dot_count += 1
-            
+
             if dot_count > 1:
                 print(f"Too many decimal points in number at line {self.line}, position {self.position}")
-                return self.__new_token(TokenType.ILLEGAL, output + self.current_char)
-            
-            output += self.source[self.position]
+                return self.__new_token(TokenType.ILLEGAL, self.source[start_pos:self.position] + self.current_char)
+
             self.__read_char()
 
             if self.current_char is None:
                 break
 
+        output: str = self.source[start_pos:self.position]
         if dot_count == 0:
             return self.__new_token(TokenType.INT, int(output))
         else:
             return self.__new_token(TokenType.FLOAT, float(output))
         
     def __read_identifier(self) -> str:
-        position = self.position
-        while self.current_char is not None and (self.__is_letter(self.current_char) or self.current_char.isalnum()):
+        # one C-level match for the whole identifier; the caller has already
+        # verified the first character, so this always matches
+        m = _IDENT_RE.match(self.source, self.position)
+        end = m.end()
+        self.position = end
+        self.read_position = end + 1
+        self.current_char = self.source[end] if end < len(self.source) else None
+        return m.group()
+
+    def next_token(self) -> Token:
+        self.__skip_whitespace()
+
+        ch = self.current_char
+        if ch is None:
+            tok = self.__new_token(TokenType.EOF, "")
             self.__read_char()
+            return tok
 
-        return self.source[position:self.position]
+        # one two-char slice + dict probe replaces the peek/concat dance;
+        # at end of source the slice is a single char and simply misses
+        pair = self.source[self.position:self.position + 2]
+        tt = _TWO_CHAR.get(pair)
+        if tt is not None:
+            self.__read_char()
+            # interned so every += literal is the same object; one-char
+            # literals already share CPython's latin-1 singletons
+            tok = self.__new_token(tt, sys.intern(pair))
+            self.__read_char()
+            return tok
 
-    def next_token(self) -> Token:
-        tok: Token = None
+        code = ord(ch)
+        tt = _SINGLE[code] if code < 128 else None
+        if tt is not None:
+            tok = self.__new_token(tt, ch)
+            self.__read_char()
+            return tok
 
-        self.__skip_whitespace()
+        if ch == '"':
+            tok = self.__new_token(TokenType.STRING, self.__read_string())
+            self.__read_char()
+            return tok
 
-        match self.current_char:
-            case '+':
-                if self.__peek_char() == '=':
-                    current_char = self.current_char
-                    self.__read_char()
-                    literal = current_char + self.current_char
-                    tok = self.__new_token(TokenType.PLUS_EQ, literal)
-                elif self.__peek_char() == '+':
-                    current_char = self.current_char
-                    self.__read_char()
-                    literal = current_char + self.current_char
-                    tok = self.__new_token(TokenType.PLUS_PLUS, literal)
-                else:
-                    tok = self.__new_token(TokenType.PLUS, self.current_char)
-            case '-':
-                # handle ->
-                if self.__peek_char() == '>':
-                    current_char = self.current_char
-                    self.__read_char()
-                    literal = current_char + self.current_char
-                    tok = self.__new_token(TokenType.ARROW, literal)
-                elif self.__peek_char() == '=':
-                    current_char = self.current_char
-                    self.__read_char()
-                    literal = current_char + self.current_char
-                    tok = self.__new_token(TokenType.MINUS_EQ, literal)
-                elif self.__peek_char() == '-':
-                    current_char = self.current_char
-                    self.__read_char()
-                    literal = current_char + self.current_char
-                    tok = self.__new_token(TokenType.MINUS_MINUS, literal)
-                else:
-                    tok = self.__new_token(TokenType.MINUS, self.current_char)
-            case '*':
-                if self.__peek_char() == '=':
-                    current_char = self.current_char
-                    self.__read_char()
-                    literal = current_char + self.current_char
-                    tok = self.__new_token(TokenType.MUL_EQ, literal)
-                else:
-                    tok = self.__new_token(TokenType.ASTERISK, self.current_char)
-            case '/':
-                if self.__peek_char() == '=':
-                    current_char = self.current_char
-                    self.__read_char()
-                    literal = current_char + self.current_char
-                    tok = self.__new_token(TokenType.DIV_EQ, literal)
-                else:
-                    tok = self.__new_token(TokenType.SLASH, self.current_char)
-            case '^':
-                tok = self.__new_token(TokenType.POWER, self.current_char)
-            case '%':
-                tok = self.__new_token(TokenType.MODULO, self.current_char)
-            case '<':
-                # handle <=
-                if self.__peek_char() == '=':
-                    current_char = self.current_char
-                    self.__read_char()
-                    literal = current_char + self.current_char
-                    tok = self.__new_token(TokenType.LT_EQ, literal)
-                else:
-                    tok = self.__new_token(TokenType.LT, self.current_char)
-            case '>':
-                # handle >=
-                if self.__peek_char() == '=':
-                    current_char = self.current_char
-                    self.__read_char()
-                    literal = current_char + self.current_char
-                    tok = self.__new_token(TokenType.GT_EQ, literal)
-                else:
-                    tok = self.__new_token(TokenType.GT, self.current_char)
-            case '=':
-                # handle ==
-                if self.__peek_char() == '=':
-                    current_char = self.current_char
-                    self.__read_char()
-                    literal = current_char + self.current_char
-                    tok = self.__new_token(TokenType.EQ_EQ, literal)
-                else:
-                    tok = self.__new_token(TokenType.EQ, self.current_char)
-            case '!':
-                # handle !=
-                if self.__peek_char() == '=':
-                    current_char = self.current_char
-                    self.__read_char()
-                    literal = current_char + self.current_char
-                    tok = self.__new_token(TokenType.NOT_EQ, literal)
-                else:
-                    tok = self.__new_token(TokenType.BANG, self.current_char)
-            case ':':
-                tok = self.__new_token(TokenType.COLON, self.current_char)
-            case ',':
-                tok = self.__new_token(TokenType.COMMA, self.current_char)
-            case '"':
-                tok = self.__new_token(TokenType.STRING, self.__read_string())
-            case ';':
-                tok = self.__new_token(TokenType.SEMICOLON, self.current_char)
-            case '(':
-                tok = self.__new_token(TokenType.LPAREN, self.current_char)
-            case ')':
-                tok = self.__new_token(TokenType.RPAREN, self.current_char)
-            case '{':
-                tok = self.__new_token(TokenType.LBRACE, self.current_char)
-            case '}':
-                tok = self.__new_token(TokenType.RBRACE, self.current_char)
-            case '.':
-                # Check for comments using "..."
-                if (self.__peek_char() == '.' and 
-                    self.read_position + 1 < len(self.source) and 
-                    self.source[self.read_position + 1] == '.'):
-                    # This is a comment, skip it and get next token
-                    self.__read_comment()
-                    return self.next_token()  # Recursively get the next non-comment token
-                else:
-                    # Single dot - treat as illegal for now (could be used for other purposes later)
-                    tok = self.__new_token(TokenType.ILLEGAL, self.current_char)
-            case None:
-                tok = self.__new_token(TokenType.EOF, "")
-            case _:
-                if self.__is_letter(self.current_char):
-                    literal: str = self.__read_identifier()
-                    tt: TokenType = lookup_ident(literal)
-                    tok = self.__new_token(tt=tt, literal=literal)
-                    return tok
-                elif self.current_char.isdigit():
-                    tok = self.__read_number_token()
-                    return tok
-                else:
-                    tok = self.__new_token(TokenType.ILLEGAL, self.current_char)
+        if ch == '.':
+            # "..." opens a comment; a lone dot stays illegal for now
+            if (self.__peek_char() == '.' and
+                self.read_position + 1 < len(self.source) and
+                self.source[self.read_position + 1] == '.'):
+                self.__read_comment()
+                return self.next_token()
+            tok = self.__new_token(TokenType.ILLEGAL, ch)
+            self.__read_char()
+            return tok
+
+        if self.__is_letter(ch):
+            # interning collapses every occurrence of a name to one str and
+            # makes the memoized keyword lookup an identity hit
+            literal: str = sys.intern(self.__read_identifier())
+            return self.__new_token(tt=lookup_ident(literal), literal=literal)
 
+        if self.__is_digit(ch):
+            return self.__read_number_token()
 
+        tok = self.__new_token(TokenType.ILLEGAL, ch)
         self.__read_char()
         return tok
-    
+
+    def tokenize_all(self) -> list[Token]:
+        """ Tokenizes the remaining source in one sweep of the master regex and
+        returns the materialized Token list, EOF included. Produces the same
+        literals, lines and positions repeated next_token calls would. """
+        tokens: list[Token] = []
+        append = tokens.append
+        source = self.source
+        scan = _TOKEN_RE.match
+        line = self.line
+        pos = self.position
+        n = len(source)
+
+        while pos < n:
+            m = scan(source, pos)
+            kind = m.lastgroup
+            end = m.end()
+
+            if kind == 'WS' or kind == 'COMMENT':
+                line += source.count('\n', pos, end)
+                pos = end
+                continue
+
+            text = m.group()
+            if kind == 'IDENT':
+                text = sys.intern(text)
+                append(Token(type=lookup_ident(text), literal=text, line=line, position=end))
+            elif kind == 'INT':
+                append(Token(type=TokenType.INT, literal=int(text), line=line, position=end))
+            elif kind == 'OP':
+                append(Token(type=_SINGLE[ord(text)], literal=text, line=line, position=pos))
+            elif kind == 'TWO':
+                append(Token(type=_TWO_CHAR[text], literal=sys.intern(text), line=line, position=pos + 1))
+            elif kind == 'FLOAT':
+                append(Token(type=TokenType.FLOAT, literal=float(text), line=line, position=end))
+            elif kind == 'STRING':
+                if len(text) >= 2 and text.endswith('"'):
+                    append(Token(type=TokenType.STRING, literal=text[1:-1], line=line, position=end - 1))
+                else:
+                    # unterminated string runs to end of file; the cursor
+                    # lands one past it, matching the incremental reader
+                    append(Token(type=TokenType.STRING, literal=text[1:], line=line, position=end))
+                    pos = end + 1
+                    continue
+            elif kind == 'BADNUM':
+                print(f"Too many decimal points in number at line {line}, position {end}")
+                append(Token(type=TokenType.ILLEGAL, literal=text + '.', line=line, position=end))
+            else:
+                append(Token(type=TokenType.ILLEGAL, literal=text, line=line, position=pos))
+            pos = end
+
+        append(Token(type=TokenType.EOF, literal="", line=line, position=pos))
+        return tokens
+
     def __read_string(self) -> str:
         position: int = self.position + 1
         while True:
@@ -45,12 +45,39 @@ PRECEDENCES: dict[TokenType, PrecedenceType] = {
     TokenType.MINUS_MINUS: PrecedenceType.P_INDEX
 }
 
+# every TokenType mapped, defaulting to lowest; TokenType values are dense
+# ints, so a plain list subscript replaces enum hashing entirely
+PRECEDENCE_ALL: list[int] = [PrecedenceType.P_LOWEST.value] * (max(TokenType) + 1)
+for _tt, _prec in PRECEDENCES.items():
+    PRECEDENCE_ALL[_tt] = _prec.value
+
+# plain-int precedence constants for the internal Pratt paths; the enum stays
+# as the public notation
+P_LOWEST: int = PrecedenceType.P_LOWEST.value
+P_PREFIX: int = PrecedenceType.P_PREFIX.value
+
+# one bit per assignment-operator token id, so the statement-start probe is a
+# shift and a mask with no list allocation or scan
+_ASSIGN_MASK: int = (
+    (1 << TokenType.EQ) | (1 << TokenType.PLUS_EQ) | (1 << TokenType.MINUS_EQ)
+    | (1 << TokenType.MUL_EQ) | (1 << TokenType.DIV_EQ)
+)
+
 class Parser:
+    __slots__ = ("lexer", "errors", "tokens", "_i", "current_token", "peek_token",
+                 "prefix_parse_fns", "infix_parse_fns", "_prefix", "_infix",
+                 "_stmt_dispatch")
+
     def __init__(self, lexer: Lexer) -> None:
         self.lexer: Lexer = lexer
-        
+
         self.errors: list[str] = []
-    
+
+        # drain the lexer once; advancing is then an index bump into this
+        # list instead of a method call back into the lexer per token
+        self.tokens: list[Token] = lexer.tokenize_all()
+        self._i: int = 0
+
         self.current_token: Token = None
         self.peek_token: Token = None
 
@@ -87,13 +114,44 @@ class Parser:
             TokenType.MINUS_MINUS: self.__parse_postfix_expression
         }
 
+        # list mirrors of the dispatch dicts, indexed by the dense token id;
+        # the dicts stay as the registration surface, the Pratt loop reads
+        # these to avoid hashing an enum per token
+        n = max(TokenType) + 1
+        self._prefix: list[Callable | None] = [None] * n
+        for tt, fn in self.prefix_parse_fns.items():
+            self._prefix[tt] = fn
+        self._infix: list[Callable | None] = [None] * n
+        for tt, fn in self.infix_parse_fns.items():
+            self._infix[tt] = fn
+
+        # statement dispatch by dense token id; anything unlisted parses as
+        # an expression statement. let and ident-assignment keep guards in
+        # __parse_statement for their trailing-semicolon handling
+        self._stmt_dispatch: list[Callable] = [self.__parse_expression_statement] * n
+        for tt, fn in {
+            TokenType.FN: self.__parse_function_statement,
+            TokenType.RETURN: self.__parse_return_statement,
+            TokenType.WHILE: self.__parse_while_statement,
+            TokenType.BREAK: self.__parse_break_statement,
+            TokenType.CONTINUE: self.__parse_continue_statement,
+            TokenType.FOR: self.__parse_for_statement,
+            TokenType.IMPORT: self.__parse_import_statement,
+        }.items():
+            self._stmt_dispatch[tt] = fn
+
         self.__next_token()
         self.__next_token()
 
     # region Parser Helpers
     def __next_token(self) -> None:
         self.current_token = self.peek_token
-        self.peek_token = self.lexer.next_token()
+        i = self._i
+        tokens = self.tokens
+        # the trailing EOF repeats if a rule advances past it, exactly as the
+        # pull lexer kept answering EOF
+        self.peek_token = tokens[i] if i < len(tokens) else tokens[-1]
+        self._i = i + 1
 
     def __current_token_is(self, tt: TokenType) -> bool:
         return self.current_token.type == tt
@@ -102,15 +160,7 @@ class Parser:
         return self.peek_token.type == tt
     
     def __peek_token_is_assignment(self) -> bool:
-        assignment_operators: list[TokenType] = [
-            TokenType.EQ,
-            TokenType.PLUS_EQ,
-            TokenType.MINUS_EQ,
-            TokenType.MUL_EQ,
-            TokenType.DIV_EQ
-        ]
-
-        return self.peek_token.type in assignment_operators
+        return bool((_ASSIGN_MASK >> self.peek_token.type) & 1)
     
     def __expect_peek(self, tt: TokenType) -> bool:
         if self.__peek_token_is(tt):
@@ -120,17 +170,11 @@ class Parser:
             self.__peek_error(tt)
             return False
         
-    def __current_precedence(self) -> PrecedenceType:
-        prec: int | None = PRECEDENCES.get(self.current_token.type)
-        if prec is None:
-            return PrecedenceType.P_LOWEST
-        return prec
-    
-    def __peek_precedence(self) -> PrecedenceType:
-        prec: int | None = PRECEDENCES.get(self.peek_token.type)
-        if prec is None:
-            return PrecedenceType.P_LOWEST
-        return prec
+    def __current_precedence(self) -> int:
+        return PRECEDENCE_ALL[self.current_token.type]
+
+    def __peek_precedence(self) -> int:
+        return PRECEDENCE_ALL[self.peek_token.type]
         
     def __peek_error(self, tt: TokenType) -> None:
         self.errors.append(
@@ -146,56 +190,46 @@ class Parser:
     def parse_program(self) -> None:
         program: Program = Program()
 
+        # hoisted bound methods keep the per-statement loop free of repeated
+        # attribute lookups
+        append = program.statements.append
+        parse_statement = self.__parse_statement
+        advance = self.__next_token
+
         while self.current_token.type != TokenType.EOF:
-            stmt: Statement = self.__parse_statement()
+            stmt: Statement = parse_statement()
             if stmt is not None:
-                program.statements.append(stmt)
-            self.__next_token()
-        
+                append(stmt)
+            advance()
+
         return program
     
     # region statement methods
     def __parse_statement(self) -> Statement:
-        if self.current_token.type == TokenType.IDENT and self.__peek_token_is_assignment():
+        tt = self.current_token.type
+        if tt == TokenType.IDENT and self.__peek_token_is_assignment():
             stmt = self.__parse_assignment_statement()
             # Handle semicolon for assignment statements in statement context
             if self.__peek_token_is(TokenType.SEMICOLON):
                 self.__next_token()
             return stmt
 
-        match self.current_token.type:
-            case TokenType.LET:
-                stmt = self.__parse_let_statement()
-                # Handle semicolon for let statements in statement context
-                if self.__peek_token_is(TokenType.SEMICOLON):
-                    self.__next_token()
-                return stmt
-            case TokenType.FN:
-                return self.__parse_function_statement()
-            case TokenType.RETURN:
-                return self.__parse_return_statement()
-            case TokenType.WHILE:
-                return self.__parse_while_statement()
-            case TokenType.BREAK:
-                return self.__parse_break_statement()
-            case TokenType.CONTINUE:
-                return self.__parse_continue_statement()
-            case TokenType.FOR:
-                return self.__parse_for_statement()
-            case TokenType.IMPORT:
-                return self.__parse_import_statement()
-            case _:
-                return self.__parse_expression_statement()
+        if tt == TokenType.LET:
+            stmt = self.__parse_let_statement()
+            # Handle semicolon for let statements in statement context
+            if self.__peek_token_is(TokenType.SEMICOLON):
+                self.__next_token()
+            return stmt
+
+        return self._stmt_dispatch[tt]()
     
     def __parse_expression_statement(self) -> ExpressionStatement:
-        expr = self.__parse_expression(PrecedenceType.P_LOWEST)
+        expr = self.__parse_expression(P_LOWEST)
 
         if self.__peek_token_is(TokenType.SEMICOLON):
             self.__next_token()
 
-        stmt: ExpressionStatement = ExpressionStatement(expr=expr)
-
-        return stmt
+        return ExpressionStatement(expr)
     
     def __parse_let_statement(self) -> LetStatement:
         # let a: int = 10;
@@ -204,7 +238,7 @@ class Parser:
         if not self.__expect_peek(TokenType.IDENT):
             return None
         
-        stmt.name = IdentifierLiteral(value=self.current_token.literal)
+        stmt.name = IdentifierLiteral(self.current_token.literal)
 
         if not self.__expect_peek(TokenType.COLON):
             return None
@@ -219,7 +253,7 @@ class Parser:
         
         self.__next_token()
 
-        stmt.value = self.__parse_expression(PrecedenceType.P_LOWEST)
+        stmt.value = self.__parse_expression(P_LOWEST)
 
         # Don't automatically consume semicolon - let the caller handle it
         return stmt
@@ -231,7 +265,7 @@ class Parser:
         if not self.__expect_peek(TokenType.IDENT):
             return None
         
-        stmt.name = IdentifierLiteral(value=self.current_token.literal)
+        stmt.name = IdentifierLiteral(self.current_token.literal)
 
         if not self.__expect_peek(TokenType.LPAREN):
             return None
@@ -262,7 +296,7 @@ class Parser:
         
         self.__next_token()
 
-        first_param: FunctionParameter = FunctionParameter(name=self.current_token.literal)
+        first_param: FunctionParameter = FunctionParameter(self.current_token.literal)
 
         if not self.__expect_peek(TokenType.COLON):
             return None
@@ -276,7 +310,7 @@ class Parser:
             self.__next_token()
             self.__next_token()
 
-            param: FunctionParameter = FunctionParameter(name=self.current_token.literal)
+            param: FunctionParameter = FunctionParameter(self.current_token.literal)
 
             if not self.__expect_peek(TokenType.COLON):
                 return None
@@ -297,7 +331,7 @@ class Parser:
 
         self.__next_token()
 
-        stmt.return_value = self.__parse_expression(PrecedenceType.P_LOWEST)
+        stmt.return_value = self.__parse_expression(P_LOWEST)
         
         if not self.__expect_peek(TokenType.SEMICOLON):
             return None
@@ -308,20 +342,24 @@ class Parser:
     def __parse_block_statement(self) -> BlockStatement:
         block_stmt: BlockStatement = BlockStatement()
 
-        self.__next_token()
+        append = block_stmt.statements.append
+        parse_statement = self.__parse_statement
+        advance = self.__next_token
+
+        advance()
 
-        while not self.__current_token_is(TokenType.RBRACE) and not self.__current_token_is(TokenType.EOF):
-            stmt: Statement = self.__parse_statement()
+        while self.current_token.type != TokenType.RBRACE and self.current_token.type != TokenType.EOF:
+            stmt: Statement = parse_statement()
             if stmt is not None:
-                block_stmt.statements.append(stmt)
-            self.__next_token()
-        
+                append(stmt)
+            advance()
+
         return block_stmt
     
     def __parse_assignment_statement(self) -> AssignStatement:
         stmt: AssignStatement = AssignStatement()
 
-        stmt.ident = IdentifierLiteral(value=self.current_token.literal)
+        stmt.ident = IdentifierLiteral(self.current_token.literal)
 
         # Check for any assignment operator
         if not self.__peek_token_is_assignment():
@@ -332,7 +370,7 @@ class Parser:
         
         self.__next_token()  # Move to the right-hand side
 
-        stmt.right_value = self.__parse_expression(PrecedenceType.P_LOWEST)
+        stmt.right_value = self.__parse_expression(P_LOWEST)
 
         # Don't automatically consume semicolon - let the caller handle it
         return stmt
@@ -344,7 +382,7 @@ class Parser:
 
         self.__next_token()
 
-        condition = self.__parse_expression(PrecedenceType.P_LOWEST)
+        condition = self.__parse_expression(P_LOWEST)
 
         if not self.__expect_peek(TokenType.LBRACE):
             return None
@@ -367,14 +405,14 @@ class Parser:
 
         self.__next_token()
 
-        condition = self.__parse_expression(PrecedenceType.P_LOWEST)
+        condition = self.__parse_expression(P_LOWEST)
 
         if not self.__expect_peek(TokenType.LBRACE):
             return None
         
         body = self.__parse_block_statement()
 
-        return WhileStatement(condition=condition, body=body)
+        return WhileStatement(condition, body)
     
     def __parse_break_statement(self) -> BreakStatement:
         if self.__peek_token_is(TokenType.SEMICOLON):
@@ -402,14 +440,14 @@ class Parser:
         
         self.__next_token()
 
-        stmt.condition = self.__parse_expression(PrecedenceType.P_LOWEST)
+        stmt.condition = self.__parse_expression(P_LOWEST)
 
         if not self.__expect_peek(TokenType.SEMICOLON):
             return None
         
         self.__next_token()
         
-        stmt.increment = self.__parse_expression(PrecedenceType.P_LOWEST)
+        stmt.increment = self.__parse_expression(P_LOWEST)
 
         if not self.__expect_peek(TokenType.RPAREN):
             return None
@@ -427,8 +465,7 @@ class Parser:
             return None
         
         # Create a StringLiteral for the module name
-        module_name = StringLiteral(value=self.current_token.literal)
-        stmt: ImportStatement = ImportStatement(module_name=module_name)
+        stmt: ImportStatement = ImportStatement(StringLiteral(self.current_token.literal))
 
         if self.__peek_token_is(TokenType.SEMICOLON):
             self.__next_token()
@@ -437,31 +474,36 @@ class Parser:
     # endregion statement methods
 
     # region expression methods
-    def __parse_expression(self, precedence: PrecedenceType) -> Expression:
-        prefix: Callable | None = self.prefix_parse_fns.get(self.current_token.type)
+    def __parse_expression(self, precedence: int) -> Expression:
+        prefix: Callable | None = self._prefix[self.current_token.type]
         if prefix is None:
             self.__no_prefix_parse_fn_error(self.current_token.type)
             return None
         
         left_expr: Expression = prefix()
 
-        while (not self.__peek_token_is(TokenType.SEMICOLON) and
-               precedence.value < self.__peek_precedence().value):
-            infix: Callable | None = self.infix_parse_fns.get(self.peek_token.type)
+        # table and sentinel hoisted; the peek checks are inlined so each
+        # trip around the precedence climb is a couple of list indexes
+        infix_fns = self._infix
+        prec_all = PRECEDENCE_ALL
+        semicolon = TokenType.SEMICOLON
+
+        while True:
+            peek_tt = self.peek_token.type
+            if peek_tt == semicolon or precedence >= prec_all[peek_tt]:
+                break
+            infix: Callable | None = infix_fns[peek_tt]
             if infix is None:
                 return left_expr
-            
+
             self.__next_token()
 
             left_expr = infix(left_expr)
-        
+
         return left_expr
     
     def __parse_infix_expression(self, left_node: Expression) -> Expression:
-        infix_expr: InfixExpression = InfixExpression(
-            left_node=left_node,
-            operator=self.current_token.literal
-        )
+        infix_expr: InfixExpression = InfixExpression(left_node, self.current_token.literal)
 
         precedence = self.__current_precedence()
         self.__next_token()
@@ -472,7 +514,7 @@ class Parser:
     def __parse_grouped_expression(self) -> Expression:
         self.__next_token()
 
-        expr: Expression = self.__parse_expression(PrecedenceType.P_LOWEST)
+        expr: Expression = self.__parse_expression(P_LOWEST)
 
         if not self.__expect_peek(TokenType.RPAREN):
             return None
@@ -480,9 +522,7 @@ class Parser:
         return expr
     
     def __parse_call_expression(self, function) -> CallExpression:
-        expr: CallExpression = CallExpression(function=function)
-        expr.arguments = self.__parse_expression_list(TokenType.RPAREN)
-        return expr   
+        return CallExpression(function, self.__parse_expression_list(TokenType.RPAREN))
     
     def __parse_expression_list(self, end: TokenType) -> list[Expression]:
         e_list: list[Expression] = []
@@ -493,12 +533,12 @@ class Parser:
         
         self.__next_token()
 
-        e_list.append(self.__parse_expression(PrecedenceType.P_LOWEST))
+        e_list.append(self.__parse_expression(P_LOWEST))
 
         while self.__peek_token_is(TokenType.COMMA):
             self.__next_token()
             self.__next_token()
-            e_list.append(self.__parse_expression(PrecedenceType.P_LOWEST))
+            e_list.append(self.__parse_expression(P_LOWEST))
         
         if not self.__expect_peek(end):
             return None
@@ -508,52 +548,33 @@ class Parser:
 
     # region prefix methods
     def __parse_prefix_expression(self) -> PrefixExpression:
-        prefix_expr: PrefixExpression = PrefixExpression(operator=self.current_token.literal)
+        prefix_expr: PrefixExpression = PrefixExpression(self.current_token.literal)
 
         self.__next_token()
 
-        prefix_expr.right_node = self.__parse_expression(PrecedenceType.P_PREFIX)
+        prefix_expr.right_node = self.__parse_expression(P_PREFIX)
 
         return prefix_expr
     
     def __parse_postfix_expression(self, left_node: Expression) -> PostfixExpression:
-        postfix_expr: PostfixExpression = PostfixExpression(
-            left_node=left_node,
-            operator=self.current_token.literal
-        )
-
-        return postfix_expr
+        return PostfixExpression(left_node, self.current_token.literal)
 
     def __parse_identifier(self) -> IdentifierLiteral:
-        return IdentifierLiteral(value=self.current_token.literal)
+        return IdentifierLiteral(self.current_token.literal)
 
     def __parse_int_literal(self) -> Expression:
-        """Parses an integer literal from the current token."""
-        int_lit: IntegerLiteral = IntegerLiteral()
+        """Parses an integer literal from the current token. The lexer already
+        converted the literal, so this is a plain assignment. """
+        return IntegerLiteral(self.current_token.literal)
 
-        try:
-            int_lit.value = int(self.current_token.literal)
-        except:
-            self.errors.append(f"Could not parse `{self.current_token.literal}` as integer")
-            return None
-        
-        return int_lit
-    
     def __parse_float_literal(self) -> Expression:
-        """Parses a float literal from the current token."""
-        float_lit: FloatLiteral = FloatLiteral()
-
-        try:
-            float_lit.value = float(self.current_token.literal)
-        except:
-            self.errors.append(f"Could not parse `{self.current_token.literal}` as float")
-            return None
-        
-        return float_lit
+        """Parses a float literal from the current token. The lexer already
+        converted the literal, so this is a plain assignment. """
+        return FloatLiteral(self.current_token.literal)
         
     def __parse_boolean(self) -> BooleanLiteral:
-        return BooleanLiteral(value=self.__current_token_is(TokenType.TRUE))
+        return BooleanLiteral(self.current_token.type == TokenType.TRUE)
     
     def __parse_string_literal(self) -> StringLiteral:
-        return StringLiteral(value=self.current_token.literal)
+        return StringLiteral(self.current_token.literal)
     # endregion prefix methods
\ No newline at end of file
@@ -1,76 +1,87 @@
-from enum import Enum
+from enum import Enum, IntEnum, auto
 from typing import Any
 
-class TokenType(Enum):
+class TokenType(IntEnum):
+    """ Token kinds with dense integer values, so dispatch and precedence
+    tables can be plain lists indexed by the member itself. """
+
+    # keep the Enum-style rendering in error messages and debug dumps
+    __str__ = Enum.__str__
+    __repr__ = Enum.__repr__
+    __format__ = Enum.__format__
+
     #Special Tokens
-    EOF = "EOF"
-    ILLEGAL = "ILLEGAL"
+    EOF = auto()
+    ILLEGAL = auto()
 
     #data types
-    IDENT = "IDENT"
-    INT = "INT"
-    FLOAT = "FLOAT"
-    STRING = "STRING"
+    IDENT = auto()
+    INT = auto()
+    FLOAT = auto()
+    STRING = auto()
 
     #arithemtic operators
-    PLUS = "PLUS"
-    MINUS = "MINUS"
-    ASTERISK = "ASTERISK"
-    SLASH = "SLASH"
-    POWER = "POWER"
-    MODULO = "MODULO"
+    PLUS = auto()
+    MINUS = auto()
+    ASTERISK = auto()
+    SLASH = auto()
+    POWER = auto()
+    MODULO = auto()
 
     # assignment operator
-    EQ = "EQ"
-    PLUS_EQ = "PLUS_EQ"
-    MINUS_EQ = "MINUS_EQ"
-    MUL_EQ = "MUL_EQ"
-    DIV_EQ = "DIV_EQ"
+    EQ = auto()
+    PLUS_EQ = auto()
+    MINUS_EQ = auto()
+    MUL_EQ = auto()
+    DIV_EQ = auto()
 
     # comparison operators
-    LT = "<"
-    GT = ">"
-    EQ_EQ = "=="
-    NOT_EQ = "!="
-    LT_EQ = "<="
-    GT_EQ = ">="
+    LT = auto()
+    GT = auto()
+    EQ_EQ = auto()
+    NOT_EQ = auto()
+    LT_EQ = auto()
+    GT_EQ = auto()
 
     #symbols
-    COLON = "COLON"
-    COMMA = "COMMA"
-    SEMICOLON = "SEMICOLON"
-    ARROW = "ARROW"
-    LPAREN = "LPAREN"
-    RPAREN = "RPAREN"
-    LBRACE = "LBRACE"
-    RBRACE = "RBRACE"
+    COLON = auto()
+    COMMA = auto()
+    SEMICOLON = auto()
+    ARROW = auto()
+    LPAREN = auto()
+    RPAREN = auto()
+    LBRACE = auto()
+    RBRACE = auto()
 
     # prefix operators
-    BANG = "BANG"
+    BANG = auto()
 
     # postfix operators
-    PLUS_PLUS = "PLUS_PLUS"
-    MINUS_MINUS = "MINUS_MINUS"
+    PLUS_PLUS = auto()
+    MINUS_MINUS = auto()
 
     #keywords
-    LET = "LET"
-    FN = "FN"
-    RETURN = "RETURN"
-    IF = "IF"
-    ELSE = "ELSE"
-    TRUE = "TRUE"
-    FALSE = "FALSE"
-    WHILE = "WHILE"
-    BREAK = "BREAK"
-    CONTINUE = "CONTINUE"
-    FOR = "FOR"
-    IMPORT = "IMPORT"
+    LET = auto()
+    FN = auto()
+    RETURN = auto()
+    IF = auto()
+    ELSE = auto()
+    TRUE = auto()
+    FALSE = auto()
+    WHILE = auto()
+    BREAK = auto()
+    CONTINUE = auto()
+    FOR = auto()
+    IMPORT = auto()
 
     # typing
-    TYPE = "TYPE"
+    TYPE = auto()
 
 
 class Token:
+    # tokens are created by the million; slots drop the per-instance dict
+    __slots__ = ("type", "literal", "line", "position")
+
     def __init__(self, type: TokenType, literal: Any, line: int, position: int) -> None:
         self.type = type
         self.literal = literal
@@ -116,16 +127,13 @@ ALT_KEYWORDS: dict[str, TokenType] = {
 
 TYPE_KEYWORDS: list[str] = ["int", "float", "str", "void"]
 
+# the three keyword tables merged once at import time; anything absent is a
+# plain identifier, so classification is a single dict probe
+_IDENT_TABLE: dict[str, TokenType] = {
+    **KEYWORDS,
+    **ALT_KEYWORDS,
+    **{kw: TokenType.TYPE for kw in TYPE_KEYWORDS},
+}
+
 def lookup_ident(ident: str) -> TokenType:
-    tt: TokenType | None = KEYWORDS.get(ident)
-    if tt is not None:
-        return tt
-    
-    tt: TokenType | None = ALT_KEYWORDS.get(ident)
-    if tt is not None:
-        return tt
-    
-    if ident in TYPE_KEYWORDS:
-        return TokenType.TYPE
-    
-    return TokenType.IDENT
+    return _IDENT_TABLE.get(ident, TokenType.IDENT)
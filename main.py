@@ -2,16 +2,14 @@ from lime_lexer import Lexer
 from lime_parser import Parser
 from lime_ast import Program
 from compiler import Compiler
-import json
+import functools
+import hashlib
+import re
 import time
 from argparse import ArgumentParser, Namespace
 import sys
 import os
 
-from llvmlite import ir
-import llvmlite.binding as llvm
-from ctypes import CFUNCTYPE, c_int, c_float
-
 def parse_args() -> Namespace:
     parser = ArgumentParser(description="Lime v0.1 - A simple programming language built using Python")
     parser.add_argument("source_file", type=str, help="Path to the source .lime file")
@@ -19,6 +17,15 @@ def parse_args() -> Namespace:
     parser.add_argument("--debug-parser", action="store_true", help="Enable parser debug output")
     parser.add_argument("--debug-compiler", action="store_true", help="Enable compiler debug output")
     parser.add_argument("--no-run", action="store_true", help="Compile but do not execute the code")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached bitcode and object code for this run")
+    parser.add_argument("--O", type=int, default=0, choices=[0, 1, 2, 3], dest="opt_level",
+                        help="LLVM optimization level to run before the JIT (default 0)")
+    parser.add_argument("--verify-ir", action="store_true",
+                        help="Run LLVM's module verifier on the generated IR (always on with --debug-compiler); skipping it saves a full IR walk")
+    parser.add_argument("--emit-object", type=str, default=None, metavar="PATH",
+                        help="Write the compiled native object file to PATH and exit without running")
+    parser.add_argument("--emit-asm", type=str, default=None, metavar="PATH",
+                        help="Write the generated native assembly to PATH and exit without running")
     return parser.parse_args()
 
 LEXER_DEBUG: bool = False
@@ -28,6 +35,57 @@ RUN_CODE: bool = True
 
 PROD_DEBUG: bool = False
 
+# import statements are statically enumerable: a keyword followed by a
+# string literal, in either spelling
+_IMPORT_RE = re.compile(r'\bimportt?\s*"([^"]*)"')
+
+def _source_hash(source_code: str) -> str:
+    """ Hashes the program source together with every module it transitively
+    imports, so cached artifacts go stale when any file in the closure
+    changes. Path resolution mirrors the compiler's import probe. """
+    h = hashlib.blake2b(source_code.encode("utf8"))
+    seen: set[str] = set()
+    work: list[str] = _IMPORT_RE.findall(source_code)
+    while work:
+        raw = work.pop()
+        name = raw[:-5] if raw.endswith(".lime") else raw
+        if name in seen:
+            continue
+        seen.add(name)
+        for path in (os.path.join("tests", f"{name}.lime"),
+                     os.path.join(".", f"{name}.lime"),
+                     f"{name}.lime"):
+            if os.path.isfile(path):
+                try:
+                    with open(path, "rb") as f:
+                        imported = f.read()
+                except OSError:
+                    break
+                h.update(imported)
+                work.extend(_IMPORT_RE.findall(imported.decode("utf8")))
+                break
+    return h.hexdigest()[:16]
+
+def _dump_debug(path: str, data: bytes) -> None:
+    """ Writes a debug artifact, creating its directory on first use. """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+@functools.lru_cache(maxsize=1)
+def _default_triple() -> str:
+    import llvmlite.binding as llvm
+    return llvm.get_default_triple()
+
+@functools.lru_cache(maxsize=1)
+def _target_machine():
+    """ Native-target init and target-machine construction hit the LLVM C
+    API; memoized so repeated driver invocations in one process pay once. """
+    import llvmlite.binding as llvm
+    llvm.initialize_native_target()
+    llvm.initialize_native_asmprinter()
+    return llvm.Target.from_default_triple().create_target_machine()
+
 if __name__ == "__main__":
     args = parse_args()
 
@@ -40,8 +98,9 @@ if __name__ == "__main__":
     file_path: str = args.source_file
 
     try:
-        with open(file_path, "r") as f:
-            source_code: str = f.read()
+        # one read + one decode, skipping TextIOWrapper's chunked decoding
+        with open(file_path, "rb") as f:
+            source_code: str = f.read().decode("utf8")
     except FileNotFoundError:
         print(f"Error: Could not find file '{file_path}'")
         print("Please check that the file path is correct and the file exists.")
@@ -50,92 +109,206 @@ if __name__ == "__main__":
         print(f"Error reading file '{file_path}': {e}")
         exit(1)
 
-    if LEXER_DEBUG:
-        print("------ LEXER DEBUG --------")
-        debug_lexer: Lexer = Lexer(source=source_code)
-        while debug_lexer.current_char is not None:
-            print(debug_lexer.next_token())
+    # Re-runs of an unchanged source file load cached output and skip as much
+    # of the pipeline as possible: a cached object file skips lexing, parsing,
+    # IR generation and codegen; cached bitcode skips everything up to
+    # codegen. Debug modes always take the full pipeline since they need the
+    # intermediate structures.
+    source_hash: str = _source_hash(source_code)
+    module_name: str = os.path.splitext(os.path.basename(file_path))[0]
+    bc_path: str = os.path.join(Compiler.AST_CACHE_DIR, f"{module_name}.{source_hash}.bc")
+    obj_path: str | None = None
 
-    l: Lexer = Lexer(source=source_code)
-    p: Parser = Parser(lexer=l)
+    # emitting always takes the full pipeline; --emit-asm needs the parsed IR
+    # either way, so neither cache applies
+    EMIT_CODE: bool = args.emit_object is not None or args.emit_asm is not None
 
-    parse_start_time = time.time()
-    program: Program = p.parse_program()
-    parse_end_time = time.time()
-
-    if len(p.errors) > 0:
-        print("Parser encountered the following errors:")
-        for err in p.errors:
-            print(f"\t{err}")
-        exit(1)
+    cache_enabled: bool = (RUN_CODE and not EMIT_CODE and not args.no_cache
+                           and not (LEXER_DEBUG or PARSER_DEBUG or COMPILER_DEBUG))
 
-    if PARSER_DEBUG:
-        print("------ PARSER DEBUG --------")
-        
+    cached_object: bytes | None = None
+    cached_bitcode: bytes | None = None
+    if cache_enabled:
+        # the object is machine code: its cache name carries the opt level
+        # and a target-triple tag so a cache directory that moves between
+        # machines or levels never links a mismatched object
+        triple_tag: str = hashlib.blake2b(_default_triple().encode("utf8")).hexdigest()[:8]
+        obj_path = os.path.join(Compiler.AST_CACHE_DIR,
+                                f"{module_name}.{source_hash}.O{args.opt_level}.{triple_tag}.o")
         try:
-            with open("debug/ast.json", "w") as f:
-                json.dump(program.json(), f, indent=4)
-            print("Wrote AST to debug/ast.json successfully!")
-        except Exception as e:
-            print(f"Warning: Could not write AST debug file: {e}")
+            with open(obj_path, "rb") as f:
+                cached_object = f.read()
+        except OSError:
+            try:
+                with open(bc_path, "rb") as f:
+                    cached_bitcode = f.read()
+            except OSError:
+                pass
 
-    c: Compiler = Compiler()
+    parse_start_time = parse_end_time = 0
+    compiler_start_time = compiler_end_time = 0
 
-    compiler_start_time = time.time()
-    c.compile(node=program)
-    compiler_end_time = time.time()
-    
-    # Check for compilation errors
-    if len(c.errors) > 0:
-        print("Compiler encountered the following errors:")
-        for err in c.errors:
-            print(f"\t{err}")
-        exit(1)
+    if cached_object is None and cached_bitcode is None:
+        l: Lexer = Lexer(source=source_code)
+        p: Parser = Parser(lexer=l)
 
-    # output steps
-    module: ir.Module = c.module
-    module.triple = llvm.get_default_triple()
+        if LEXER_DEBUG:
+            # the parser already materialized the token stream; print that
+            # list instead of lexing the source a second time
+            print("------ LEXER DEBUG --------")
+            for token in p.tokens:
+                print(token)
 
-    if COMPILER_DEBUG:
-        print("------ COMPILER DEBUG --------")
-        try:
-            with open("debug/ir.ll", "w") as f:
-                f.write(str(module))
-            print("Wrote LLVM IR to debug/ir.ll successfully!")
-        except Exception as e:
-            print(f"Warning: Could not write LLVM debug file: {e}")
+        parse_start_time = time.perf_counter_ns()
+        program: Program = p.parse_program()
+        parse_end_time = time.perf_counter_ns()
 
-    if RUN_CODE:
-        # llvm.initialize()
-        llvm.initialize_native_target()
-        llvm.initialize_native_asmprinter()
+        if len(p.errors) > 0:
+            print("Parser encountered the following errors:")
+            for err in p.errors:
+                print(f"\t{err}")
+            exit(1)
 
-        try:
-            llvm_ir_parsed = llvm.parse_assembly(str(module))
-            llvm_ir_parsed.verify()
-        except Exception as e:
-            print("Error verifying LLVM IR:")
-            print(e)
+        if PARSER_DEBUG:
+            print("------ PARSER DEBUG --------")
+
+            try:
+                # serialization only exists on this branch, so the encoder is
+                # imported here; orjson dumps the tree in C when available
+                try:
+                    import orjson
+                    ast_bytes = orjson.dumps(program.json(), option=orjson.OPT_INDENT_2)
+                except ImportError:
+                    import json
+                    ast_bytes = json.dumps(program.json(), indent=2).encode("utf8")
+                _dump_debug("debug/ast.json", ast_bytes)
+                print("Wrote AST to debug/ast.json successfully!")
+            except Exception as e:
+                print(f"Warning: Could not write AST debug file: {e}")
+
+        c: Compiler = Compiler()
+
+        compiler_start_time = time.perf_counter_ns()
+        c.compile(node=program)
+        compiler_end_time = time.perf_counter_ns()
+    
+        # Check for compilation errors
+        if len(c.errors) > 0:
+            print("Compiler encountered the following errors:")
+            for err in c.errors:
+                print(f"\t{err}")
             exit(1)
 
+        # output steps
+        module = c.module
+
+        # serialize the module once; the debug dump and parse_assembly read
+        # the same text
+        ir_text: str | None = None
+        if RUN_CODE or EMIT_CODE:
+            module.triple = _default_triple()
+        if RUN_CODE or EMIT_CODE or COMPILER_DEBUG:
+            ir_text = str(module)
+
+        if COMPILER_DEBUG:
+            print("------ COMPILER DEBUG --------")
+            try:
+                _dump_debug("debug/ir.ll", ir_text.encode("utf8"))
+                print("Wrote LLVM IR to debug/ir.ll successfully!")
+            except Exception as e:
+                print(f"Warning: Could not write LLVM debug file: {e}")
+
+    if RUN_CODE or EMIT_CODE:
+        # the JIT machinery is only paid for when code actually runs or is
+        # emitted; --no-run and pure debug passes never load the LLVM binding
+        import llvmlite.binding as llvm
+        from ctypes import CFUNCTYPE, c_int
+
+        target_machine = _target_machine()
+
+        if cached_object is None:
+            try:
+                if cached_bitcode is not None:
+                    llvm_ir_parsed = llvm.parse_bitcode(cached_bitcode)
+                else:
+                    llvm_ir_parsed = llvm.parse_assembly(ir_text)
+                # the verifier re-walks the whole module checking SSA and
+                # type invariants; for IR this compiler just emitted that is
+                # a development aid, not a production necessity
+                if COMPILER_DEBUG or args.verify_ir:
+                    llvm_ir_parsed.verify()
+            except Exception as e:
+                print("Error verifying LLVM IR:")
+                print(e)
+                exit(1)
+
+            if args.opt_level > 0:
+                # standard IR-level pipeline at the requested level; smaller
+                # IR lowers faster and the generated main runs faster
+                pto = llvm.create_pipeline_tuning_options(speed_level=args.opt_level)
+                pass_builder = llvm.create_pass_builder(target_machine, pto)
+                pass_builder.getModulePassManager().run(llvm_ir_parsed, pass_builder)
+
+            # codegen runs exactly once: the object emitted here both feeds
+            # the engine below and lands in the cache for future runs
+            object_code: bytes = target_machine.emit_object(llvm_ir_parsed)
+
+            if cache_enabled:
+                try:
+                    os.makedirs(Compiler.AST_CACHE_DIR, exist_ok=True)
+                    if cached_bitcode is None:
+                        with open(bc_path, "wb") as f:
+                            f.write(llvm_ir_parsed.as_bitcode())
+                    # tmp + rename so a crashed run never leaves a truncated
+                    # object behind
+                    tmp_path = obj_path + ".tmp"
+                    with open(tmp_path, "wb") as f:
+                        f.write(object_code)
+                    os.replace(tmp_path, obj_path)
+                except OSError:
+                    pass
+        else:
+            object_code = cached_object
+
+        if EMIT_CODE:
+            # AOT output: write the requested artifacts and stop short of
+            # constructing the JIT
+            try:
+                if args.emit_object is not None:
+                    with open(args.emit_object, "wb") as f:
+                        f.write(object_code)
+                if args.emit_asm is not None:
+                    with open(args.emit_asm, "w") as f:
+                        f.write(target_machine.emit_assembly(llvm_ir_parsed))
+            except OSError as e:
+                print(f"Error writing emitted code: {e}")
+                exit(1)
+            exit(0)
+
         try:
-            target_machine = llvm.Target.from_default_triple().create_target_machine()
-            engine = llvm.create_mcjit_compiler(llvm_ir_parsed, target_machine)
-            engine.finalize_object()
+            # ORC's LLJIT materializes symbols on lookup instead of MCJIT's
+            # monolithic finalize; the tracker keeps the library alive while
+            # main runs
+            lljit = llvm.create_lljit_compiler(target_machine)
+            tracker = (llvm.JITLibraryBuilder()
+                       .add_object_img(object_code)
+                       .add_current_process()
+                       .export_symbol("main")
+                       .link(lljit, module_name))
 
-            entry = engine.get_function_address("main")
+            entry = tracker["main"]
             cfunc = CFUNCTYPE(c_int)(entry)
 
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             result = cfunc()
-            end_time = time.time()
+            end_time = time.perf_counter_ns()
 
             if PROD_DEBUG:
-                print(f'\n\nProgram returned: {result}\n=== Execution Time: {round((end_time - start_time) * 1000, 6)} ms ===')
-                print(f'=== Parsing Time: {round((parse_end_time - parse_start_time) * 1000, 6)} ms ===')
-                print(f'=== Compilation Time: {round((compiler_end_time - compiler_start_time) * 1000, 6)} ms ===')
+                print(f'\n\nProgram returned: {result}\n=== Execution Time: {round((end_time - start_time) / 1_000_000, 6)} ms ===')
+                print(f'=== Parsing Time: {round((parse_end_time - parse_start_time) / 1_000_000, 6)} ms ===')
+                print(f'=== Compilation Time: {round((compiler_end_time - compiler_start_time) / 1_000_000, 6)} ms ===')
 
-            print(f'\n\nProgram returned: {result}\n=== Execution Time: {round((end_time - start_time) * 1000, 6)} ms ===')
+            print(f'\n\nProgram returned: {result}\n=== Execution Time: {round((end_time - start_time) / 1_000_000, 6)} ms ===')
             
         except Exception as e:
             print(f"Runtime error: {e}")